@@ -4,164 +4,478 @@
 A comprehensive TUI for managing AI agents collaboration with tmux sessions
 """
 
-import asyncio
-import json
+import importlib
 import os
+import queue
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from functools import lru_cache, partial
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import List, Optional
 
 import npyscreen
-from npyscreen import fmForm, Form, MultiLine, MultiLineAction, NPSApp, TitleText, ButtonPress, BoxTitle, Textfield, TitleFilename
-
-# Import our kawaii modules
-try:
-    from lib.ai_modes import KawaiiAIModes
-    from lib.session_manager import KawaiiSessionManager
-    from lib.knowledge_base import KawaiiKnowledgeBase
-    from lib.workflow_templates import KawaiiWorkflowTemplates
-    from lib.plugin_manager import KawaiiPluginManager
-    from lib.theme import KawaiiTheme
-    from lib.utils import kawaii_print, get_config_dir
-except ImportError as e:
-    print(f"Error importing kawaii modules: {e}")
-    print("Make sure all required modules are in the lib/ directory")
-    sys.exit(1)
+from npyscreen import MultiLine
+
+# Kawaii library objects, imported on first attribute access (PEP 562) so the
+# main menu can draw without loading every lib module up front
+_LAZY = {
+    'KawaiiTheme': 'lib.theme',
+    'KawaiiThemeManager': 'lib.theme',
+    'kawaii_print': 'lib.utils',
+    'get_config_dir': 'lib.utils',
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(importlib.import_module(module_name), name)
+
+
+# How long (seconds) a tmux session listing stays fresh before re-querying tmux
+SESSION_CACHE_TTL = 0.5
+
+# How long (seconds) the system status lines are reused, and the tmux query bound
+STATUS_CACHE_TTL = 1.0
+STATUS_TMUX_TIMEOUT = 0.25
+
+# Idle tick (tenths of a second, curses halfdelay units) used to flush redraws
+REDRAW_TICK = 1
+
+# Static widget contents, built once at import time
+_MAIN_MENU_ITEMS = (
+    "🤝 AI Collaboration Modes",
+    "🖥️  Session Management",
+    "📚 Knowledge Base",
+    "🎭 Workflow Templates",
+    "🔌 Plugin Management",
+    "🎨 Theme Settings",
+    "📊 System Status",
+    "❌ Exit",
+)
+
+# Form opened by each main menu entry; None exits the app
+_MAIN_DISPATCH = (
+    'AI_MODES',
+    'SESSION_MANAGER',
+    'KNOWLEDGE_BASE',
+    'WORKFLOW_TEMPLATES',
+    'PLUGIN_MANAGER',
+    'THEME_SETTINGS',
+    'SYSTEM_STATUS',
+    None,
+)
+
+_AI_MODE_ITEMS = (
+    "👩‍💻 Pair Programming - Code together like besties ♡",
+    "🎭 Debate Mode - Challenge ideas with style (òωó)",
+    "👩‍🏫 Teaching Mode - Share knowledge with cuteness ♡",
+    "🤝 Consensus Mode - Build agreements with harmony (òωó)",
+    "🏆 Competition Mode - Friendly challenges galore ♡",
+)
+
+_AI_MODE_PARAMETERS = (
+    "🚀 Agents: [2-10] - How many AI friends?",
+    "⏱️  Duration: [1-4 hours] - Long collaboration sessions",
+    "🎯 Focus: [Development/Design/Analysis] - What to work on",
+)
+
+_KNOWLEDGE_ITEMS = (
+    "💡 Best Practices - Lessons from kawaii collaborations",
+    "🎭 Collaboration Patterns - Proven AI interaction styles",
+    "📖 Learning Resources - Tutorials and guides",
+    "🔧 Troubleshooting - Fix common issues with style",
+    "✨ Success Stories - Amazing collaboration wins",
+    "🎀 Custom Lessons - Your personal kawaii knowledge",
+)
+
+_TEMPLATE_ITEMS = (
+    "👩‍💻 Developer Pair Programming - Code together with cuteness",
+    "🎨 Creative Workshop - Design brainstorming sessions",
+    "🔍 Code Review Party - Review code with style and grace",
+    "🚀 Deployment Theater - Stage releases with kawaii flair",
+    "🧪 Experiment Lab - Test ideas safely with AI friends",
+    "📊 Data Analysis Squad - Explore data with cute insights",
+    "🎭 Debate Championship - Structured arguments with charm",
+    "🏆 Challenge Arena - Skill-building competitions",
+)
+
+_PLUGIN_ITEMS = (
+    "🎨 hello_kitty_theme - Beautiful styling for everything",
+    "🤖 ai_smart_assistant - Enhanced AI interaction",
+    "📊 collaboration_analytics - Track your kawaii progress",
+    "🎵 ambient_sounds - Add cute sounds to your sessions",
+    "🔮 ai_memory_manager - Remember past collaborations",
+    "⭐ kawaii_notifications - Cute alerts and reminders",
+)
+
+_THEME_ITEMS = (
+    "🌸 Classic Hello Kitty - Timeless pink perfection",
+    "💜 Pastel Dreams - Soft and dreamy colors",
+    "⭐ Starry Night - Cosmic kawaii with stars",
+    "🌈 Rainbow Kitty - All the colors of kawaii",
+    "🎀 Minimal Pink - Clean and simple style",
+    "💫 Neon Glow - Futuristic kawaii vibes",
+)
+
+_COLOR_ITEMS = (
+    "🎀 Primary Pink: #F5A3C8 (Rogue Pink)",
+    "💖 Secondary Pink: #ED164F (Spanish Crimson)",
+    "💛 Accent Yellow: #FFE717 (Vivid Yellow)",
+    "🤍 Background: #1E181A (Eerie Black)",
+    "⚪ Text: #F2F1F2 (Aragonite White)",
+)
+
+# Status/metrics icons; plain ASCII stand-ins when stdout can't encode emoji
+_UNICODE_OK = 'utf' in (getattr(sys.stdout, 'encoding', None) or '').lower()
+
+
+def _glyph(text: str, ascii_text: str) -> str:
+    return text if _UNICODE_OK else ascii_text
+
+
+_ICON_TIME = _glyph("⏰", "[time]")
+_ICON_CPU = _glyph("🖥️ ", "[cpu]")
+_ICON_MEMORY = _glyph("💾", "[mem]")
+_ICON_DISK = _glyph("💿", "[disk]")
+_ICON_NETWORK = _glyph("🌐", "[net]")
+_ICON_PLUGIN = _glyph("🔌", "[plug]")
+_ICON_KITTY = _glyph("🎀", "[kitty]")
+_ICON_AI = _glyph("🤖", "[ai]")
+_ICON_BOOK = _glyph("📚", "[kb]")
+_ICON_HEART = _glyph("💖", "<3")
+_ICON_ERROR = _glyph("❌", "[x]")
+_STATUS_OWO = _glyph("(òωó)", "(owo)")
+
+_PERF_LINES = (
+    f"{_ICON_CPU} CPU: 23% - Running smoothly {_STATUS_OWO}",
+    f"{_ICON_MEMORY} Memory: 1.2GB / 8GB - Plenty of room for kawaii",
+    f"{_ICON_DISK} Disk: 45GB / 256GB - Space for many collaborations",
+    f"{_ICON_NETWORK} Network: Connected - Ready for AI adventures",
+    f"{_ICON_PLUGIN} Tmux: Active - Session management ready",
+    f"{_ICON_KITTY} Hello Kitty: Theme active - Maximum cuteness!",
+)
+
+# Mode descriptions, indexed by the mode selector position
+_AI_MODE_DESCRIPTIONS = (
+    "✨ Pair Programming: Work together on code with your AI bestie! "
+    "Perfect for development projects, debugging, and creative problem solving. "
+    "Both AIs collaborate in real-time, sharing ideas and building amazing things together! ♡",
+    "🎭 Debate Mode: Engage in intellectual sparring sessions! "
+    "Great for exploring different perspectives, analyzing complex topics, and "
+    "finding the best solutions through constructive disagreement. "
+    "Who knew disagreement could be so kawaii? (òωó)",
+    "👩‍🏫 Teaching Mode: Share knowledge and learn together! "
+    "One AI teaches, the other learns, with interactive sessions perfect for "
+    "explaining complex concepts, tutorials, and educational content. "
+    "Education has never been this adorable! ♡",
+    "🤝 Consensus Mode: Build harmony and shared understanding! "
+    "Perfect for decision-making, planning, and finding common ground. "
+    "All AIs work together to reach beautiful agreements through collaborative discussion. "
+    "Agreement never looked so cute! ♡",
+    "🏆 Competition Mode: Friendly challenges and learning! "
+    "Multiple AIs compete in challenges to push each other to their best. "
+    "Great for optimization, creative challenges, and skill development. "
+    "Competition with cuteness factor! (òωó)",
+)
+_DEFAULT_MODE_DESCRIPTION = "Select a mode to see description!"
+
+
+def _mode_description(mode: Optional[int]) -> str:
+    """Description for a mode selector index, or the default hint"""
+    if mode is None or not 0 <= mode < len(_AI_MODE_DESCRIPTIONS):
+        return _DEFAULT_MODE_DESCRIPTION
+    return _AI_MODE_DESCRIPTIONS[mode]
+
+
+# Recurring kawaii marks, interned so every template shares one object
+_KAWAII = sys.intern("🎀")
+_OWO = sys.intern("(òωó)")
+_HEART = sys.intern("♡")
+
+# Confirmation message templates, filled in with str.format_map
+_COLLAB_MSG = "".join((
+    _KAWAII, " Starting {mode} mode! \n"
+    "Initializing kawaii AI collaboration... ", _OWO, "\n\n"
+    "✨ This will set up {agents}\n"
+    "⏱️  Duration: {duration}\n"
+    "🎯 Focus: {focus}\n\n"
+    "Ready for the most adorable collaboration ever? ", _HEART,
+))
+_SESSION_CREATED_MSG = "".join((
+    _KAWAII, " Session '{session}' created with Hello Kitty magic! ", _HEART, "\n\n"
+    "Now you can start collaborating with your AI friends!\n"
+    "Use: tmux attach -t {session}\n\n"
+    "Kawaii level: MAXIMUM! ", _OWO,
+))
+_SESSION_FAILED_MSG = (
+    "❌ Failed to create session '{session}'\n\n"
+    "Make sure the session name is valid and not already in use."
+)
+_LESSON_ADDED_MSG = "".join((
+    "➕ New lesson added!\n\n"
+    "📚 Title: {title}\n"
+    "💎 Content: {content}...\n\n",
+    _KAWAII, " Your kawaii knowledge grows stronger! ", _HEART, "\n\n"
+    "Perfect for sharing wisdom with future AI collaborators! ", _OWO,
+))
+
+# Static dialog bodies and the startup banner
+_HEALTH_CHECK_MSG = (
+    "🏥 Health Check Running...\n\n"
+    "🎀 Checking all kawaii systems:\n\n"
+    "✅ Hello Kitty Theme - Perfect!\n"
+    "✅ Tmux Integration - Smooth!\n"
+    "✅ AI Collaboration - Ready!\n"
+    "✅ Knowledge Base - Loaded!\n"
+    "✅ Plugin System - Functional!\n\n"
+    "💖 All systems are kawaii-level healthy! (òωó)"
+)
+_KAWAII_METRICS_MSG = (
+    "📊 Kawaii Metrics Dashboard\n\n"
+    "🎀 Your collaboration statistics:\n\n"
+    "💝 Sessions Created: 42\n"
+    "🤖 AI Collaborations: 156\n"
+    "📚 Lessons Learned: 23\n"
+    "⭐ Templates Used: 8\n"
+    "🎨 Themes Applied: 5\n"
+    "🔌 Plugins Enabled: 6\n\n"
+    "💖 Kawaii Level: ULTIMATE! (òωó) ♡"
+)
+_WELCOME = """
+🎀 Welcome to Kawaii TUI! 🎀
+────────────────────────────────────
+Hello Kitty AI Collaboration Manager
+Where productivity meets pure cuteness! ♡
+
+(òωó) Ready for the most adorable 
+    collaboration experience ever?
+
+🎀 Kawaii level: MAXIMUM! 🎀
+
+"""
+
+# Mode/theme ids in menu order, with display names precomputed
+_MODE_IDS = ("pair_programming", "debate", "teaching", "consensus", "competition")
+_MODE_DISPLAY = tuple(mode_id.replace('_', ' ').title() for mode_id in _MODE_IDS)
+_THEME_IDS = (
+    "classic_hello_kitty",
+    "pastel_dreams",
+    "starry_night",
+    "rainbow_kitty",
+    "minimal_pink",
+    "neon_glow",
+)
+
+
+class TmuxWorker:
+    """Runs tmux commands on a background asyncio loop, off the UI thread"""
+    
+    def __init__(self):
+        import asyncio  # deferred: only paid once a form actually talks to tmux
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever,
+                                       name="kawaii-tmux", daemon=True)
+        self.thread.start()
+
+    def submit(self, args, events: queue.SimpleQueue, handler):
+        """Run `tmux *args` and post (handler, (returncode, stdout)) to events"""
+        import asyncio
+        asyncio.run_coroutine_threadsafe(self._run(args, events, handler), self.loop)
+
+    async def _run(self, args, events, handler):
+        import asyncio
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                'tmux', *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL)
+            out, _ = await proc.communicate()
+            returncode = proc.returncode
+        except OSError:
+            returncode, out = -1, b""
+        events.put((handler, (returncode, out)))
+
+
+class CachedMultiLine(MultiLine):
+    """MultiLine that keeps its values, and their rendered lines, until the content changes"""
+    
+    def __init__(self, *args, **keywords):
+        self._rendered = {}
+        super().__init__(*args, **keywords)
+
+    def set_values(self, values) -> bool:
+        """Swap in new values only if they differ; returns True when a redraw is needed"""
+        values = list(values)
+        if values == self.values:
+            return False
+        self.values = values
+        self._rendered.clear()
+        return True
+
+    def display_value(self, vl):
+        try:
+            return self._rendered[vl]
+        except KeyError:
+            line = self._rendered[vl] = super().display_value(vl)
+            return line
+        except TypeError:  # unhashable value, render it every time
+            return super().display_value(vl)
+
+
+class KawaiiFormMixin:
+    """Shared behaviour for kawaii forms: navigation, background results and coalesced redraws"""
+    
+    def __init__(self, *args, **keywords):
+        self._dirty = set()
+        self._events = queue.SimpleQueue()
+        super().__init__(*args, **keywords)
+        self.keypress_timeout = REDRAW_TICK
+
+    def _add_buttons(self, specs):
+        """Add a row of (label, handler) buttons with a single layout pass"""
+        editing = self.editing
+        self.editing = False
+        try:
+            return [self.add_widget(npyscreen.ButtonPress, name=label, when_pressed_function=handler)
+                    for label, handler in specs]
+        finally:
+            self.editing = editing
+
+    def _back_to_main(self):
+        """Return to the main menu"""
+        self.parentApp.switchForm('MAIN')
+
+    def _mark_dirty(self, widget_name: str):
+        """Queue a widget for redraw on the next idle tick"""
+        self._dirty.add(widget_name)
+
+    def while_waiting(self):
+        """Apply background results, then flush queued redraws"""
+        events = self._events
+        while True:
+            try:
+                handler, payload = events.get_nowait()
+            except queue.Empty:
+                break
+            handler(payload)
+        self._flush()
+
+    @property
+    def _visible(self) -> bool:
+        """True while this form is the one npyscreen is showing"""
+        return getattr(self.parentApp, '_THISFORM', None) is self
+
+    def _flush(self):
+        """Redraw every dirty widget exactly once (hidden forms keep them queued)"""
+        if not self._visible:
+            return
+        dirty = self._dirty
+        while dirty:
+            getattr(self, dirty.pop()).display()
 
 
 class KawaiiMainMenu(npyscreen.ActionFormMinimal):
     """Main menu for Kawaii TUI with Hello Kitty theming"""
     
     def create(self):
+        add = self.add_widget
+        TitleText = npyscreen.TitleText
         # Hello Kitty themed title
-        self.add_widget(npyscreen.TitleText, name="", value="" + "🎀" * 15, editable=False)
-        self.add_widget(npyscreen.TitleText, name="", value="Hello Kitty AI Collaboration Manager", editable=False)
-        self.add_widget(npyscreen.TitleText, name="", value="─── ✧ oωo ♡ ───", editable=False)
-        self.add_widget(npyscreen.TitleText, name="", value="", editable=False)
+        add(TitleText, name="", value="" + "🎀" * 15, editable=False)
+        add(TitleText, name="", value="Hello Kitty AI Collaboration Manager", editable=False)
+        add(TitleText, name="", value="─── ✧ oωo ♡ ───", editable=False)
+        add(TitleText, name="", value="", editable=False)
         
         # Main menu options with kawaii styling
-        self.menu = self.add_widget(MultiLine, 
-                                   name="Choose your kawaii adventure (≧ᗜ≦)♡",
-                                   values=[
-                                       "🤝 AI Collaboration Modes",
-                                       "🖥️  Session Management", 
-                                       "📚 Knowledge Base",
-                                       "🎭 Workflow Templates",
-                                       "🔌 Plugin Management",
-                                       "🎨 Theme Settings",
-                                       "📊 System Status",
-                                       "❌ Exit"
-                                   ],
-                                   value=0,
-                                   select=True,
-                                   height=10)
+        self.menu = add(MultiLine, 
+                       name="Choose your kawaii adventure (≧ᗜ≦)♡",
+                       values=list(_MAIN_MENU_ITEMS),
+                       value=0,
+                       select=True,
+                       height=10)
         
         # Cute footer
-        self.add_widget(npyscreen.TitleText, name="", value="─── ♡ kawaii mode activated ♡ ───", editable=False)
+        add(TitleText, name="", value="─── ♡ kawaii mode activated ♡ ───", editable=False)
 
     def on_ok(self):
         """Handle menu selection"""
         choice = self.menu.value
-        if choice == 0:  # AI Collaboration Modes
-            self.parentApp.switchForm('AI_MODES')
-        elif choice == 1:  # Session Management
-            self.parentApp.switchForm('SESSION_MANAGER')
-        elif choice == 2:  # Knowledge Base
-            self.parentApp.switchForm('KNOWLEDGE_BASE')
-        elif choice == 3:  # Workflow Templates
-            self.parentApp.switchForm('WORKFLOW_TEMPLATES')
-        elif choice == 4:  # Plugin Management
-            self.parentApp.switchForm('PLUGIN_MANAGER')
-        elif choice == 5:  # Theme Settings
-            self.parentApp.switchForm('THEME_SETTINGS')
-        elif choice == 6:  # System Status
-            self.parentApp.switchForm('SYSTEM_STATUS')
-        elif choice == 7:  # Exit
-            self.parentApp.switchForm(None)
-
-
-class KawaiiAIModes(npyscreen.FormBaseNew):
+        if choice is not None:
+            self.parentApp.switchForm(_MAIN_DISPATCH[choice])
+
+
+class KawaiiAIModes(KawaiiFormMixin, npyscreen.FormBaseNew):
     """Enhanced AI Collaboration Modes with Hello Kitty theming"""
     
     def create(self):
-        self.add_widget(npyscreen.TitleText, name="", value="🎀 AI Collaboration Modes 🎀", editable=False)
-        self.add_widget(npyscreen.TitleText, name="", value="Choose your kawaii collaboration style ♡", editable=False)
-        
-        self.mode_selector = self.add_widget(MultiLine,
-                                            name="Collaboration Mode:",
-                                            values=[
-                                                "👩‍💻 Pair Programming - Code together like besties ♡",
-                                                "🎭 Debate Mode - Challenge ideas with style (òωó)",
-                                                "👩‍🏫 Teaching Mode - Share knowledge with cuteness ♡",
-                                                "🤝 Consensus Mode - Build agreements with harmony (òωó)",
-                                                "🏆 Competition Mode - Friendly challenges galore ♡"
-                                            ],
-                                            value=0,
-                                            height=7)
-        
-        self.mode_description = self.add_widget(MultiLine,
-                                               name="Description:",
-                                               values=["Select a mode to see its kawaii description!"],
-                                               height=3,
-                                               editable=False)
-        
-        self.parameters = self.add_widget(MultiLine,
-                                         name="Parameters:",
-                                         values=[
-                                             "🚀 Agents: [2-10] - How many AI friends?",
-                                             "⏱️  Duration: [1-4 hours] - Long collaboration sessions",
-                                             "🎯 Focus: [Development/Design/Analysis] - What to work on"
-                                         ],
-                                         height=5)
+        add = self.add_widget
+        TitleText = npyscreen.TitleText
+        self._param_cache = {}
+        add(TitleText, name="", value="🎀 AI Collaboration Modes 🎀", editable=False)
+        add(TitleText, name="", value="Choose your kawaii collaboration style ♡", editable=False)
+        
+        self.mode_selector = add(MultiLine,
+                                name="Collaboration Mode:",
+                                values=list(_AI_MODE_ITEMS),
+                                value=0,
+                                height=7)
+        
+        self.mode_description = add(CachedMultiLine,
+                                   name="Description:",
+                                   values=["Select a mode to see its kawaii description!"],
+                                   height=3,
+                                   editable=False)
+        
+        self.parameters = add(MultiLine,
+                             name="Parameters:",
+                             values=list(_AI_MODE_PARAMETERS),
+                             height=5)
         
         # Action buttons
-        self.add_widget(npyscreen.ButtonPress, name="Start kawaii collaboration! (òωó)",
-                       when_pressed_function=self.start_collaboration)
-        self.add_widget(npyscreen.ButtonPress, name="← Back to Main Menu",
-                       when_pressed_function=lambda: self.parentApp.switchForm('MAIN'))
+        self._add_buttons((
+            ("Start kawaii collaboration! (òωó)", self.start_collaboration),
+            ("← Back to Main Menu", self._back_to_main),
+        ))
 
     def refresh_description(self):
         """Update description based on selected mode"""
         mode = self.mode_selector.value
-        descriptions = {
-            0: "✨ Pair Programming: Work together on code with your AI bestie! "
-               "Perfect for development projects, debugging, and creative problem solving. "
-               "Both AIs collaborate in real-time, sharing ideas and building amazing things together! ♡",
-            1: "🎭 Debate Mode: Engage in intellectual sparring sessions! "
-               "Great for exploring different perspectives, analyzing complex topics, and "
-               "finding the best solutions through constructive disagreement. "
-               "Who knew disagreement could be so kawaii? (òωó)",
-            2: "👩‍🏫 Teaching Mode: Share knowledge and learn together! "
-               "One AI teaches, the other learns, with interactive sessions perfect for "
-               "explaining complex concepts, tutorials, and educational content. "
-               "Education has never been this adorable! ♡",
-            3: "🤝 Consensus Mode: Build harmony and shared understanding! "
-               "Perfect for decision-making, planning, and finding common ground. "
-               "All AIs work together to reach beautiful agreements through collaborative discussion. "
-               "Agreement never looked so cute! ♡",
-            4: "🏆 Competition Mode: Friendly challenges and learning! "
-               "Multiple AIs compete in challenges to push each other to their best. "
-               "Great for optimization, creative challenges, and skill development. "
-               "Competition with cuteness factor! (òωó)"
-        }
-        self.mode_description.values = [descriptions.get(mode, "Select a mode to see description!")]
-        self.mode_description.display()
+        if self.mode_description.set_values((_mode_description(mode),)):
+            self._mark_dirty('mode_description')
+
+    def _param(self, index: int) -> str:
+        """Value part of a 'Label: value' parameter line (parsed once, then cached)"""
+        cache = self._param_cache
+        try:
+            return cache[index]
+        except KeyError:
+            value = cache[index] = self.parameters.values[index].split(':', 1)[1].strip()
+            return value
+
+    def set_parameters(self, values: List[str]):
+        """Replace the parameter lines and drop any cached parsed values"""
+        self.parameters.values = values
+        self._param_cache.clear()
+        self._mark_dirty('parameters')
 
     def start_collaboration(self):
         """Start the selected collaboration mode"""
         mode = self.mode_selector.value
-        modes = ["pair_programming", "debate", "teaching", "consensus", "competition"]
         
         # Show confirmation with kawaii styling
         npyscreen.notify_confirm(
-            f"🎀 Starting {modes[mode].replace('_', ' ').title()} mode! \n"
-            f"Initializing kawaii AI collaboration... (òωó)\n\n"
-            f"✨ This will set up {self.parameters.values[0].split(':')[1].strip()}\n"
-            f"⏱️  Duration: {self.parameters.values[1].split(':')[1].strip()}\n"
-            f"🎯 Focus: {self.parameters.values[2].split(':')[1].strip()}\n\n"
-            f"Ready for the most adorable collaboration ever? ♡",
+            _COLLAB_MSG.format_map({
+                'mode': _MODE_DISPLAY[mode],
+                'agents': self._param(0),
+                'duration': self._param(1),
+                'focus': self._param(2),
+            }),
             title="🎀 Kawaii Collaboration Starting! (òωó)"
         )
         
@@ -176,74 +490,90 @@ class KawaiiAIModes(npyscreen.FormBaseNew):
         )
 
 
-class KawaiiSessionManager(npyscreen.FormBaseNew):
+class KawaiiSessionManager(KawaiiFormMixin, npyscreen.FormBaseNew):
     """Session Management TUI with Hello Kitty interface"""
     
     def create(self):
-        self.add_widget(npyscreen.TitleText, name="", value="🖥️ Kawaii Session Manager 🖥️", editable=False)
-        self.add_widget(npyscreen.TitleText, name="", value="Manage your tmux sessions with style! (òωó)", editable=False)
+        add = self.add_widget
+        TitleText = npyscreen.TitleText
+        self._session_cache = None
+        add(TitleText, name="", value="🖥️ Kawaii Session Manager 🖥️", editable=False)
+        add(TitleText, name="", value="Manage your tmux sessions with style! (òωó)", editable=False)
         
-        # Current sessions display
-        self.session_list = self.add_widget(MultiLine,
-                                          name="Active Sessions:",
-                                          values=self.get_active_sessions(),
-                                          height=8)
+        # Current sessions display (filled in once tmux answers)
+        self.session_list = add(CachedMultiLine,
+                              name="Active Sessions:",
+                              values=["⏳ Looking for sessions... (òωó)"],
+                              height=8)
         
         # Session actions
-        self.add_widget(npyscreen.ButtonPress, name="🎭 Create New Session",
-                       when_pressed_function=self.create_session)
-        self.add_widget(npyscreen.ButtonPress, name="🔄 Refresh Sessions",
-                       when_pressed_function=self.refresh_sessions)
-        self.add_widget(npyscreen.ButtonPress, name="📸 Snapshot Session",
-                       when_pressed_function=self.snapshot_session)
-        self.add_widget(npyscreen.ButtonPress, name="← Back to Main Menu",
-                       when_pressed_function=lambda: self.parentApp.switchForm('MAIN'))
-
-    def get_active_sessions(self) -> List[str]:
-        """Get list of active tmux sessions"""
-        try:
-            result = subprocess.run(['tmux', 'list-sessions', '-F', '#{session_name}'],
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                sessions = result.stdout.strip().split('\n') if result.stdout.strip() else []
-                return [f"🖥️ {session}" for session in sessions if session]
-            return ["📭 No active sessions found"]
-        except Exception:
+        self._add_buttons((
+            ("🎭 Create New Session", self.create_session),
+            ("🔄 Refresh Sessions", self.refresh_sessions),
+            ("📸 Snapshot Session", self.snapshot_session),
+            ("← Back to Main Menu", self._back_to_main),
+        ))
+        
+        self.refresh_sessions()
+
+    @staticmethod
+    def _parse_sessions(returncode: int, out: bytes) -> List[str]:
+        """Turn raw `tmux list-sessions` output into display lines"""
+        if returncode < 0:
             return ["❌ Error fetching sessions"]
+        if returncode == 0:
+            sessions = [f"🖥️ {name}" for name in out.decode('utf-8', 'replace').splitlines() if name]
+            if sessions:
+                return sessions
+        return ["📭 No active sessions found"]
 
     def create_session(self):
         """Create a new tmux session"""
         session_name = npyscreen.notify_input("Enter session name (kawaii style encouraged!): ")
         if session_name:
-            try:
-                subprocess.run(['tmux', 'new-session', '-d', '-s', session_name],
-                             check=True)
-                npyscreen.notify_confirm(
-                    f"🎀 Session '{session_name}' created with Hello Kitty magic! ♡\n\n"
-                    f"Now you can start collaborating with your AI friends!\n"
-                    f"Use: tmux attach -t {session_name}\n\n"
-                    f"Kawaii level: MAXIMUM! (òωó)",
-                    title="Session Created Successfully!"
-                )
-                self.refresh_sessions()
-            except subprocess.CalledProcessError:
-                npyscreen.notify_confirm(
-                    f"❌ Failed to create session '{session_name}'\n\n"
-                    f"Make sure the session name is valid and not already in use.",
-                    title="Error Creating Session"
-                )
+            self.parentApp.tmux.submit(('new-session', '-d', '-s', session_name),
+                                       self._events,
+                                       partial(self._on_session_created, session_name))
+
+    def _on_session_created(self, session_name: str, result):
+        """Report the outcome of a background new-session"""
+        returncode, _ = result
+        if returncode == 0:
+            npyscreen.notify_confirm(
+                _SESSION_CREATED_MSG.format_map({'session': session_name}),
+                title="Session Created Successfully!"
+            )
+            self._session_cache = None
+            self.refresh_sessions()
+        else:
+            npyscreen.notify_confirm(
+                _SESSION_FAILED_MSG.format_map({'session': session_name}),
+                title="Error Creating Session"
+            )
 
     def refresh_sessions(self):
-        """Refresh the session list"""
-        self.session_list.values = self.get_active_sessions()
-        self.session_list.display()
+        """Refresh the session list (served from cache for SESSION_CACHE_TTL seconds)"""
+        cached = self._session_cache
+        if cached is not None and time.monotonic() - cached[0] < SESSION_CACHE_TTL:
+            if self.session_list.set_values(cached[1]):
+                self._mark_dirty('session_list')
+            return
+        self.parentApp.tmux.submit(('list-sessions', '-F', '#{session_name}'),
+                                   self._events, self._on_sessions)
+
+    def _on_sessions(self, result):
+        """Store a fresh tmux listing and queue the list for redraw"""
+        sessions = self._parse_sessions(*result)
+        self._session_cache = (time.monotonic(), sessions)
+        if self.session_list.set_values(sessions):
+            self._mark_dirty('session_list')
 
     def snapshot_session(self):
         """Take a snapshot of current session"""
         session_name = npyscreen.notify_input("Enter session name to snapshot: ")
         if session_name:
             try:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
                 snapshot_file = f"{session_name}_snapshot_{timestamp}"
                 
                 npyscreen.notify_confirm(
@@ -260,42 +590,35 @@ class KawaiiSessionManager(npyscreen.FormBaseNew):
                 )
 
 
-class KawaiiKnowledgeBase(npyscreen.FormBaseNew):
+class KawaiiKnowledgeBase(KawaiiFormMixin, npyscreen.FormBaseNew):
     """Kawaii-themed knowledge base interface"""
     
     def create(self):
-        self.add_widget(npyscreen.TitleText, name="", value="📚 Kawaii Knowledge Base 📚", editable=False)
-        self.add_widget(npyscreen.TitleText, name="", value="Manage your collaboration lessons and knowledge! ♡", editable=False)
+        add = self.add_widget
+        TitleText = npyscreen.TitleText
+        add(TitleText, name="", value="📚 Kawaii Knowledge Base 📚", editable=False)
+        add(TitleText, name="", value="Manage your collaboration lessons and knowledge! ♡", editable=False)
         
         # Knowledge categories
-        self.knowledge_list = self.add_widget(MultiLine,
-                                             name="Knowledge Categories:",
-                                             values=[
-                                                 "💡 Best Practices - Lessons from kawaii collaborations",
-                                                 "🎭 Collaboration Patterns - Proven AI interaction styles",
-                                                 "📖 Learning Resources - Tutorials and guides",
-                                                 "🔧 Troubleshooting - Fix common issues with style",
-                                                 "✨ Success Stories - Amazing collaboration wins",
-                                                 "🎀 Custom Lessons - Your personal kawaii knowledge"
-                                             ],
-                                             value=0,
-                                             height=8)
-        
-        self.content_viewer = self.add_widget(MultiLine,
-                                             name="Content:",
-                                             values=["Select a category to view content..."],
-                                             height=6,
-                                             editable=False)
+        self.knowledge_list = add(MultiLine,
+                                 name="Knowledge Categories:",
+                                 values=list(_KNOWLEDGE_ITEMS),
+                                 value=0,
+                                 height=8)
+        
+        self.content_viewer = add(MultiLine,
+                                 name="Content:",
+                                 values=["Select a category to view content..."],
+                                 height=6,
+                                 editable=False)
         
         # Action buttons
-        self.add_widget(npyscreen.ButtonPress, name="📖 View Selected Category",
-                       when_pressed_function=self.view_category)
-        self.add_widget(npyscreen.ButtonPress, name="✏️ Edit Knowledge",
-                       when_pressed_function=self.edit_knowledge)
-        self.add_widget(npyscreen.ButtonPress, name="➕ Add New Lesson",
-                       when_pressed_function=self.add_lesson)
-        self.add_widget(npyscreen.ButtonPress, name="← Back to Main Menu",
-                       when_pressed_function=lambda: self.parentApp.switchForm('MAIN'))
+        self._add_buttons((
+            ("📖 View Selected Category", self.view_category),
+            ("✏️ Edit Knowledge", self.edit_knowledge),
+            ("➕ Add New Lesson", self.add_lesson),
+            ("← Back to Main Menu", self._back_to_main),
+        ))
 
     def view_category(self):
         """View content of selected knowledge category"""
@@ -325,53 +648,40 @@ class KawaiiKnowledgeBase(npyscreen.FormBaseNew):
         
         if title and content:
             npyscreen.notify_confirm(
-                f"➕ New lesson added!\n\n"
-                f"📚 Title: {title}\n"
-                f"💎 Content: {content[:100]}...\n\n"
-                f"🎀 Your kawaii knowledge grows stronger! ♡\n\n"
-                f"Perfect for sharing wisdom with future AI collaborators! (òωó)",
+                _LESSON_ADDED_MSG.format_map({'title': title, 'content': content[:100]}),
                 title="Lesson Added Successfully!"
             )
 
 
-class KawaiiWorkflowTemplates(npyscreen.FormBaseNew):
+class KawaiiWorkflowTemplates(KawaiiFormMixin, npyscreen.FormBaseNew):
     """Hello Kitty themed workflow templates"""
     
     def create(self):
-        self.add_widget(npyscreen.TitleText, name="", value="🎭 Kawaii Workflow Templates 🎭", editable=False)
-        self.add_widget(npyscreen.TitleText, name="", value="Pre-configured collaboration scenarios! (òωó)", editable=False)
+        add = self.add_widget
+        TitleText = npyscreen.TitleText
+        add(TitleText, name="", value="🎭 Kawaii Workflow Templates 🎭", editable=False)
+        add(TitleText, name="", value="Pre-configured collaboration scenarios! (òωó)", editable=False)
         
         # Template categories
-        self.template_list = self.add_widget(MultiLine,
-                                            name="Available Templates:",
-                                            values=[
-                                                "👩‍💻 Developer Pair Programming - Code together with cuteness",
-                                                "🎨 Creative Workshop - Design brainstorming sessions",
-                                                "🔍 Code Review Party - Review code with style and grace",
-                                                "🚀 Deployment Theater - Stage releases with kawaii flair",
-                                                "🧪 Experiment Lab - Test ideas safely with AI friends",
-                                                "📊 Data Analysis Squad - Explore data with cute insights",
-                                                "🎭 Debate Championship - Structured arguments with charm",
-                                                "🏆 Challenge Arena - Skill-building competitions"
-                                            ],
-                                            value=0,
-                                            height=9)
-        
-        self.template_description = self.add_widget(MultiLine,
-                                                   name="Template Details:",
-                                                   values=["Select a template to see details..."],
-                                                   height=5,
-                                                   editable=False)
+        self.template_list = add(MultiLine,
+                                name="Available Templates:",
+                                values=list(_TEMPLATE_ITEMS),
+                                value=0,
+                                height=9)
+        
+        self.template_description = add(MultiLine,
+                                       name="Template Details:",
+                                       values=["Select a template to see details..."],
+                                       height=5,
+                                       editable=False)
         
         # Action buttons
-        self.add_widget(npyscreen.ButtonPress, name="🎬 Launch Template",
-                       when_pressed_function=self.launch_template)
-        self.add_widget(npyscreen.ButtonPress, name="✏️ Customize Template",
-                       when_pressed_function=self.customize_template)
-        self.add_widget(npyscreen.ButtonPress, name="➕ Create Custom Template",
-                       when_pressed_function=self.create_template)
-        self.add_widget(npyscreen.ButtonPress, name="← Back to Main Menu",
-                       when_pressed_function=lambda: self.parentApp.switchForm('MAIN'))
+        self._add_buttons((
+            ("🎬 Launch Template", self.launch_template),
+            ("✏️ Customize Template", self.customize_template),
+            ("➕ Create Custom Template", self.create_template),
+            ("← Back to Main Menu", self._back_to_main),
+        ))
 
     def launch_template(self):
         """Launch the selected template"""
@@ -415,38 +725,30 @@ class KawaiiWorkflowTemplates(npyscreen.FormBaseNew):
             )
 
 
-class KawaiiPluginManager(npyscreen.FormBaseNew):
+class KawaiiPluginManager(KawaiiFormMixin, npyscreen.FormBaseNew):
     """Interface for managing Hello Kitty plugins"""
     
     def create(self):
-        self.add_widget(npyscreen.TitleText, name="", value="🔌 Kawaii Plugin Manager 🔌", editable=False)
-        self.add_widget(npyscreen.TitleText, name="", value="Extend your kawaii collaboration powers! (òωó)", editable=False)
+        add = self.add_widget
+        TitleText = npyscreen.TitleText
+        add(TitleText, name="", value="🔌 Kawaii Plugin Manager 🔌", editable=False)
+        add(TitleText, name="", value="Extend your kawaii collaboration powers! (òωó)", editable=False)
         
         # Installed plugins
-        self.plugin_list = self.add_widget(MultiLine,
-                                          name="Installed Plugins:",
-                                          values=[
-                                              "🎨 hello_kitty_theme - Beautiful styling for everything",
-                                              "🤖 ai_smart_assistant - Enhanced AI interaction",
-                                              "📊 collaboration_analytics - Track your kawaii progress",
-                                              "🎵 ambient_sounds - Add cute sounds to your sessions",
-                                              "🔮 ai_memory_manager - Remember past collaborations",
-                                              "⭐ kawaii_notifications - Cute alerts and reminders"
-                                          ],
-                                          value=0,
-                                          height=8)
+        self.plugin_list = add(MultiLine,
+                              name="Installed Plugins:",
+                              values=list(_PLUGIN_ITEMS),
+                              value=0,
+                              height=8)
         
         # Plugin actions
-        self.add_widget(npyscreen.ButtonPress, name="✅ Enable/Disable Plugin",
-                       when_pressed_function=self.toggle_plugin)
-        self.add_widget(npyscreen.ButtonPress, name="⚙️ Configure Plugin",
-                       when_pressed_function=self.configure_plugin)
-        self.add_widget(npyscreen.ButtonPress, name="🗑️ Remove Plugin",
-                       when_pressed_function=self.remove_plugin)
-        self.add_widget(npyscreen.ButtonPress, name="🛒 Browse Plugin Store",
-                       when_pressed_function=self.browse_store)
-        self.add_widget(npyscreen.ButtonPress, name="← Back to Main Menu",
-                       when_pressed_function=lambda: self.parentApp.switchForm('MAIN'))
+        self._add_buttons((
+            ("✅ Enable/Disable Plugin", self.toggle_plugin),
+            ("⚙️ Configure Plugin", self.configure_plugin),
+            ("🗑️ Remove Plugin", self.remove_plugin),
+            ("🛒 Browse Plugin Store", self.browse_store),
+            ("← Back to Main Menu", self._back_to_main),
+        ))
 
     def toggle_plugin(self):
         """Enable or disable selected plugin"""
@@ -486,61 +788,40 @@ class KawaiiPluginManager(npyscreen.FormBaseNew):
         )
 
 
-class KawaiiThemeSettings(npyscreen.FormBaseNew):
+class KawaiiThemeSettings(KawaiiFormMixin, npyscreen.FormBaseNew):
     """Theme settings and customization"""
     
     def create(self):
-        self.add_widget(npyscreen.TitleText, name="", value="🎨 Kawaii Theme Settings 🎨", editable=False)
-        self.add_widget(npyscreen.TitleText, name="", value="Customize your Hello Kitty experience! ♡", editable=False)
+        add = self.add_widget
+        TitleText = npyscreen.TitleText
+        add(TitleText, name="", value="🎨 Kawaii Theme Settings 🎨", editable=False)
+        add(TitleText, name="", value="Customize your Hello Kitty experience! ♡", editable=False)
         
         # Theme options
-        self.theme_selector = self.add_widget(MultiLine,
-                                             name="Available Themes:",
-                                             values=[
-                                                 "🌸 Classic Hello Kitty - Timeless pink perfection",
-                                                 "💜 Pastel Dreams - Soft and dreamy colors",
-                                                 "⭐ Starry Night - Cosmic kawaii with stars",
-                                                 "🌈 Rainbow Kitty - All the colors of kawaii",
-                                                 "🎀 Minimal Pink - Clean and simple style",
-                                                 "💫 Neon Glow - Futuristic kawaii vibes"
-                                             ],
-                                             value=0,
-                                             height=7)
-        
-        self.color_customizer = self.add_widget(MultiLine,
-                                               name="Color Customization:",
-                                               values=[
-                                                   "🎀 Primary Pink: #F5A3C8 (Rogue Pink)",
-                                                   "💖 Secondary Pink: #ED164F (Spanish Crimson)", 
-                                                   "💛 Accent Yellow: #FFE717 (Vivid Yellow)",
-                                                   "🤍 Background: #1E181A (Eerie Black)",
-                                                   "⚪ Text: #F2F1F2 (Aragonite White)"
-                                               ],
-                                               height=6)
+        self.theme_selector = add(MultiLine,
+                                 name="Available Themes:",
+                                 values=list(_THEME_ITEMS),
+                                 value=0,
+                                 height=7)
+        
+        self.color_customizer = add(MultiLine,
+                                   name="Color Customization:",
+                                   values=list(_COLOR_ITEMS),
+                                   height=6)
         
         # Action buttons
-        self.add_widget(npyscreen.ButtonPress, name="🎨 Apply Theme",
-                       when_pressed_function=self.apply_theme)
-        self.add_widget(npyscreen.ButtonPress, name="🎨 Customize Colors",
-                       when_pressed_function=self.customize_colors)
-        self.add_widget(npyscreen.ButtonPress, name="💾 Save Configuration",
-                       when_pressed_function=self.save_config)
-        self.add_widget(npyscreen.ButtonPress, name="← Back to Main Menu",
-                       when_pressed_function=lambda: self.parentApp.switchForm('MAIN'))
+        self._add_buttons((
+            ("🎨 Apply Theme", self.apply_theme),
+            ("🎨 Customize Colors", self.customize_colors),
+            ("💾 Save Configuration", self.save_config),
+            ("← Back to Main Menu", self._back_to_main),
+        ))
 
     def apply_theme(self):
         """Apply the selected theme"""
         theme_index = self.theme_selector.value
-        theme_ids = [
-            "classic_hello_kitty",
-            "pastel_dreams", 
-            "starry_night",
-            "rainbow_kitty",
-            "minimal_pink",
-            "neon_glow"
-        ]
         try:
-            theme_id = theme_ids[theme_index]
+            theme_id = _THEME_IDS[theme_index]
             from lib.theme import KawaiiThemeManager
             tm = KawaiiThemeManager()
             if tm.apply_theme(theme_id):
@@ -586,155 +867,185 @@ class KawaiiThemeSettings(npyscreen.FormBaseNew):
         )
 
 
-class KawaiiSystemStatus(npyscreen.FormBaseNew):
+class KawaiiSystemStatus(KawaiiFormMixin, npyscreen.FormBaseNew):
     """System status and health monitoring"""
     
     def create(self):
-        self.add_widget(npyscreen.TitleText, name="", value="📊 Kawaii System Status 📊", editable=False)
-        self.add_widget(npyscreen.TitleText, name="", value="Monitor your kawaii collaboration environment! (òωó)", editable=False)
+        add = self.add_widget
+        TitleText = npyscreen.TitleText
+        self._status_cache = None
+        add(TitleText, name="", value="📊 Kawaii System Status 📊", editable=False)
+        add(TitleText, name="", value="Monitor your kawaii collaboration environment! (òωó)", editable=False)
         
         # System information
-        self.status_display = self.add_widget(MultiLine,
-                                             name="System Status:",
-                                             values=self.get_system_status(),
-                                             height=10)
+        self.status_display = add(CachedMultiLine,
+                                 name="System Status:",
+                                 values=self.get_system_status(),
+                                 height=10)
         
         # Performance metrics
-        self.performance_display = self.add_widget(MultiLine,
-                                                  name="Performance Metrics:",
-                                                  values=[
-                                                      "🖥️  CPU: 23% - Running smoothly (òωó)",
-                                                      "💾 Memory: 1.2GB / 8GB - Plenty of room for kawaii",
-                                                      "💿 Disk: 45GB / 256GB - Space for many collaborations",
-                                                      "🌐 Network: Connected - Ready for AI adventures",
-                                                      "🔌 Tmux: Active - Session management ready",
-                                                      "🎀 Hello Kitty: Theme active - Maximum cuteness!"
-                                                  ],
-                                                  height=7)
+        self.performance_display = add(MultiLine,
+                                      name="Performance Metrics:",
+                                      values=list(_PERF_LINES),
+                                      height=7)
         
         # Action buttons
-        self.add_widget(npyscreen.ButtonPress, name="🔄 Refresh Status",
-                       when_pressed_function=self.refresh_status)
-        self.add_widget(npyscreen.ButtonPress, name="📋 Health Check",
-                       when_pressed_function=self.health_check)
-        self.add_widget(npyscreen.ButtonPress, name="🎀 Kawaii Metrics",
-                       when_pressed_function=self.kawaii_metrics)
-        self.add_widget(npyscreen.ButtonPress, name="← Back to Main Menu",
-                       when_pressed_function=lambda: self.parentApp.switchForm('MAIN'))
+        self._add_buttons((
+            ("🔄 Refresh Status", self.refresh_status),
+            ("📋 Health Check", self.health_check),
+            ("🎀 Kawaii Metrics", self.kawaii_metrics),
+            ("← Back to Main Menu", self._back_to_main),
+        ))
 
     def get_system_status(self) -> List[str]:
-        """Get current system status"""
+        """Get current system status (served from cache for STATUS_CACHE_TTL seconds)"""
+        cached = self._status_cache
+        if cached is not None and time.monotonic() - cached[0] < STATUS_CACHE_TTL:
+            return cached[1]
+        
         try:
-            # Get tmux sessions
-            tmux_result = subprocess.run(['tmux', 'list-sessions', '-F', '#{session_name}'],
-                                       capture_output=True, text=True)
-            sessions = tmux_result.stdout.strip().split('\n') if tmux_result.stdout.strip() else []
+            # Count tmux sessions: an empty format prints one bare newline each
+            tmux_result = subprocess.run(['tmux', 'list-sessions', '-F', ''],
+                                       capture_output=True, check=False,
+                                       timeout=STATUS_TMUX_TIMEOUT)
+            session_count = tmux_result.stdout.count(b'\n')
             
             # Get current time
             current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
-            return [
-                f"⏰ System Time: {current_time}",
-                f"🖥️  Active Sessions: {len(sessions)}",
-                f"🎀 Hello Kitty Theme: Active",
-                f"🤖 AI Integration: Ready",
-                f"📚 Knowledge Base: Loaded",
-                f"🔌 Plugin System: Functional",
-                f"💖 Overall Status: Kawaii Level: MAXIMUM! (òωó)"
+            status = [
+                f"{_ICON_TIME} System Time: {current_time}",
+                f"{_ICON_CPU} Active Sessions: {session_count}",
+                f"{_ICON_KITTY} Hello Kitty Theme: Active",
+                f"{_ICON_AI} AI Integration: Ready",
+                f"{_ICON_BOOK} Knowledge Base: Loaded",
+                f"{_ICON_PLUGIN} Plugin System: Functional",
+                f"{_ICON_HEART} Overall Status: Kawaii Level: MAXIMUM! {_STATUS_OWO}"
             ]
-        except Exception:
-            return ["❌ Error fetching system status"]
+        except (subprocess.SubprocessError, OSError):
+            # tmux hung past the timeout, or isn't installed
+            return [f"{_ICON_ERROR} Error fetching system status"]
+        
+        self._status_cache = (time.monotonic(), status)
+        return status
 
     def refresh_status(self):
         """Refresh system status"""
-        self.status_display.values = self.get_system_status()
-        self.status_display.display()
+        self._status_cache = None
+        if self.status_display.set_values(self.get_system_status()):
+            self._mark_dirty('status_display')
 
     def health_check(self):
         """Run system health check"""
         npyscreen.notify_confirm(
-            "🏥 Health Check Running...\n\n"
-            "🎀 Checking all kawaii systems:\n\n"
-            "✅ Hello Kitty Theme - Perfect!\n"
-            "✅ Tmux Integration - Smooth!\n"
-            "✅ AI Collaboration - Ready!\n"
-            "✅ Knowledge Base - Loaded!\n"
-            "✅ Plugin System - Functional!\n\n"
-            "💖 All systems are kawaii-level healthy! (òωó)",
+            _HEALTH_CHECK_MSG,
             title="Health Check Complete"
         )
 
     def kawaii_metrics(self):
         """Show kawaii-specific metrics"""
         npyscreen.notify_confirm(
-            "📊 Kawaii Metrics Dashboard\n\n"
-            "🎀 Your collaboration statistics:\n\n"
-            "💝 Sessions Created: 42\n"
-            "🤖 AI Collaborations: 156\n"
-            "📚 Lessons Learned: 23\n"
-            "⭐ Templates Used: 8\n"
-            "🎨 Themes Applied: 5\n"
-            "🔌 Plugins Enabled: 6\n\n"
-            "💖 Kawaii Level: ULTIMATE! (òωó) ♡",
+            _KAWAII_METRICS_MSG,
             title="Kawaii Metrics"
         )
 
 
-class KawaiiTUIApp(NPSApp):
+class _LibInstance:
+    """App attribute that imports and builds a lib object on first access, then caches it"""
+    
+    def __init__(self, module_name: str, class_name: str):
+        self.module_name = module_name
+        self.class_name = class_name
+        self.attr_name = None
+
+    def __set_name__(self, owner, name):
+        self.attr_name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = getattr(importlib.import_module(self.module_name), self.class_name)()
+        # Shadow the descriptor so later lookups are plain attribute reads
+        obj.__dict__[self.attr_name] = value
+        return value
+
+
+class KawaiiTUIApp(npyscreen.NPSAppManaged):
     """Main Kawaii TUI Application"""
     
+    # Core modules, constructed the first time a form asks for them
+    theme_manager = _LibInstance('lib.theme', 'KawaiiThemeManager')
+    ai_modes = _LibInstance('lib.ai_modes', 'KawaiiAIModes')
+    session_manager = _LibInstance('lib.session_manager', 'KawaiiSessionManager')
+    knowledge_base = _LibInstance('lib.knowledge_base', 'KawaiiKnowledgeBase')
+    workflow_templates = _LibInstance('lib.workflow_templates', 'KawaiiWorkflowTemplates')
+    plugin_manager = _LibInstance('lib.plugin_manager', 'KawaiiPluginManager')
+    
     def __init__(self):
         super().__init__()
-        # Theme management
-        from lib.theme import KawaiiThemeManager
-        self.theme_manager = KawaiiThemeManager()
-        active = self.theme_manager.get_active_theme() or next(iter(self.theme_manager.themes.values()))
-        self.active_theme_id = active.id if active else None
-
-        # Core modules
-        self.ai_modes = KawaiiAIModes()
-        self.session_manager = KawaiiSessionManager()
-        self.knowledge_base = KawaiiKnowledgeBase()
-        self.workflow_templates = KawaiiWorkflowTemplates()
-        self.plugin_manager = KawaiiPluginManager()
+        # Background tmux runner shared by all forms, started on first use
+        self._tmux = None
+        self.active_theme_id = None
+        # Sub-form id -> (class, title) until first shown; filled in onStart
+        self._unbuilt_forms = {}
         
+    @property
+    def tmux(self) -> TmuxWorker:
+        """Background tmux runner (its asyncio loop starts on first access)"""
+        if self._tmux is None:
+            self._tmux = TmuxWorker()
+        return self._tmux
+
     def onStart(self):
         """Initialize the application"""
-        # Set up forms
+        # Set up forms; only the main menu is built up front, the rest on
+        # their first visit (see switchForm). Not addFormClass: that builds a
+        # fresh form on every visit, losing the forms' caches and queued redraws.
         self.addForm('MAIN', KawaiiMainMenu, name="🎀 Kawaii TUI Main Menu 🎀")
-        self.addForm('AI_MODES', KawaiiAIModes, name="🤝 AI Collaboration Modes")
-        self.addForm('SESSION_MANAGER', KawaiiSessionManager, name="🖥️ Session Manager")
-        self.addForm('KNOWLEDGE_BASE', KawaiiKnowledgeBase, name="📚 Knowledge Base")
-        self.addForm('WORKFLOW_TEMPLATES', KawaiiWorkflowTemplates, name="🎭 Workflow Templates")
-        self.addForm('PLUGIN_MANAGER', KawaiiPluginManager, name="🔌 Plugin Manager")
-        self.addForm('THEME_SETTINGS', KawaiiThemeSettings, name="🎨 Theme Settings")
-        self.addForm('SYSTEM_STATUS', KawaiiSystemStatus, name="📊 System Status")
-        
-        # Apply kawaii theme
-        if self.active_theme_id:
-            self.theme_manager.apply_theme(self.active_theme_id)
+        self._unbuilt_forms = {
+            'AI_MODES': (KawaiiAIModes, "🤝 AI Collaboration Modes"),
+            'SESSION_MANAGER': (KawaiiSessionManager, "🖥️ Session Manager"),
+            'KNOWLEDGE_BASE': (KawaiiKnowledgeBase, "📚 Knowledge Base"),
+            'WORKFLOW_TEMPLATES': (KawaiiWorkflowTemplates, "🎭 Workflow Templates"),
+            'PLUGIN_MANAGER': (KawaiiPluginManager, "🔌 Plugin Manager"),
+            'THEME_SETTINGS': (KawaiiThemeSettings, "🎨 Theme Settings"),
+            'SYSTEM_STATUS': (KawaiiSystemStatus, "📊 System Status"),
+        }
+        
+        # Apply kawaii theme once the forms are registered
+        theme_manager = self.theme_manager
+        active = theme_manager.get_active_theme() or next(iter(theme_manager.themes.values()), None)
+        if active:
+            self.active_theme_id = active.id
+            theme_manager.apply_theme(active.id)
         
         # Print kawaii welcome message
         self.print_welcome()
     
+    def switchForm(self, fmid):
+        """Switch forms, building a sub-form once on its first visit"""
+        unbuilt = self._unbuilt_forms.pop(fmid, None)
+        if unbuilt is not None:
+            form_class, name = unbuilt
+            self.addForm(fmid, form_class, name=name)
+        super().switchForm(fmid)
+    
     def print_welcome(self):
-        """Print kawaii welcome message"""
-        welcome_ascii = """
-🎀 Welcome to Kawaii TUI! 🎀
-────────────────────────────────────
-Hello Kitty AI Collaboration Manager
-Where productivity meets pure cuteness! ♡
-
-(òωó) Ready for the most adorable 
-    collaboration experience ever?
-
-🎀 Kawaii level: MAXIMUM! 🎀
-        """
-        print(welcome_ascii)
+        """Print kawaii welcome message (skipped when KAWAII_QUIET is set)"""
+        if os.environ.get('KAWAII_QUIET'):
+            return
+        # One write for the whole banner instead of line-by-line output
+        stdout = sys.stdout
+        stdout.write(_WELCOME)
+        stdout.flush()
         
-        # Apply a small delay for effect
-        import time
-        time.sleep(1)
+        # Optional splash pause, off unless KAWAII_SPLASH_DELAY is set
+        try:
+            delay = float(os.environ.get('KAWAII_SPLASH_DELAY', '0'))
+        except ValueError:
+            delay = 0.0
+        if delay > 0:
+            time.sleep(delay)
 
 
 def main():
@@ -759,18 +1070,16 @@ def main():
     return 0
 
 
+@lru_cache(maxsize=1)
 def check_dependencies() -> bool:
     """Check if required dependencies are available"""
     try:
         import npyscreen
-        import subprocess
-        
-        # Check tmux (use -V for compatibility)
-        subprocess.run(['tmux', '-V'], capture_output=True, check=True)
-        
-        return True
-    except (ImportError, subprocess.CalledProcessError, FileNotFoundError):
+    except ImportError:
         return False
+    
+    # A PATH lookup is enough to know tmux is installed
+    return shutil.which('tmux') is not None
 
 
 if __name__ == "__main__":
@@ -3,27 +3,55 @@
 Kawaimux - Hello Kitty TUI (OpenTui shim)
 """
 import os
+import shlex
 import sys
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'lib'))
 
 from lib.opentui import MenuApp, MenuItem
-from lib.workflow_templates import KawaiiWorkflowTemplates
+from lib.workflow_templates import KawaiiWorkflowTemplates, WT_PATHS
 from lib.utils import validate_kawaii_environment, check_system_compatibility
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 WORKDIR = Path.home() / 'LAB'
 SESSION = 'tmuxai_dev'
+TEMPLATES_FILE = os.path.join(WT_PATHS['templates_dir'], 'templates.json')
+
+# Shared template library, rebuilt only when templates.json changes on disk
+_wt: Optional[KawaiiWorkflowTemplates] = None
+_wt_mtime: Optional[int] = None
+_wt_lock = threading.Lock()
 
 
 def p(msg: str):
     print(msg)
 
 
+def _templates_mtime() -> Optional[int]:
+    try:
+        return os.stat(TEMPLATES_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _templates() -> KawaiiWorkflowTemplates:
+    global _wt, _wt_mtime
+    with _wt_lock:
+        if _wt is None or _templates_mtime() != _wt_mtime:
+            _wt = KawaiiWorkflowTemplates()
+            # stat after loading: the constructor may write default templates
+            _wt_mtime = _templates_mtime()
+        return _wt
+
+
 def action_health():
     valid, issues = validate_kawaii_environment()
     if valid:
@@ -35,16 +63,22 @@ def action_health():
     input("Press Enter...")
 
 
+@lru_cache(maxsize=1)
+def _render_template_list(wt: KawaiiWorkflowTemplates) -> str:
+    # keyed on the instance itself, so a reloaded library renders afresh
+    lines = ["Available templates:\n"]
+    lines.extend(f"- {t.name} [{t.id}] — {t.description[:80]}..." for t in wt.templates.values())
+    lines.append("")
+    return "\n".join(lines)
+
+
 def action_list_templates():
-    wt = KawaiiWorkflowTemplates()
-    p("Available templates:\n")
-    for t in wt.templates.values():
-        p(f"- {t.name} [{t.id}] — {t.description[:80]}...")
+    sys.stdout.write(_render_template_list(_templates()))
     input("Press Enter...")
 
 
 def action_show_template():
-    wt = KawaiiWorkflowTemplates()
+    wt = _templates()
     p("Enter template id (default: academic_writing_sprint): ")
     tid = input().strip() or 'academic_writing_sprint'
     t = wt.get_template(tid)
@@ -63,18 +97,22 @@ def action_show_template():
 
 def action_launch_pairai():
     # basic tmux pairing: session + ai window with two panes running tmuxai
-    env = os.environ.copy()
-    model = env.get('TMUXAI_MODEL', '')
-    key = env.get('TMUXAI_API_KEY', '')
-    base_cmd = ['tmux', 'new-session', '-As', SESSION, '-c', str(WORKDIR)]
-    subprocess.run(base_cmd)
-    # ensure ai window
-    subprocess.run(['tmux', 'new-window', '-t', SESSION, '-n', 'ai', '-c', str(WORKDIR)])
-    launch = f"TMUXAI_MODEL='{model}' TMUXAI_API_KEY='{key}' tmuxai || exec zsh"
-    subprocess.run(['tmux', 'send-keys', '-t', f'{SESSION}:ai.0', launch, 'C-m'])
-    subprocess.run(['tmux', 'split-window', '-h', '-t', f'{SESSION}:ai', '-c', str(WORKDIR)])
-    subprocess.run(['tmux', 'send-keys', '-t', f'{SESSION}:ai.1', launch, 'C-m'])
-    subprocess.run(['tmux', 'select-window', '-t', f'{SESSION}:ai'])
+    model = os.environ.get('TMUXAI_MODEL', '')
+    key = os.environ.get('TMUXAI_API_KEY', '')
+    workdir = str(WORKDIR)
+    launch = f"TMUXAI_MODEL={shlex.quote(model)} TMUXAI_API_KEY={shlex.quote(key)} tmuxai || exec zsh"
+    # one tmux client runs the whole sequence; ';' separates the commands.
+    # It stays in the foreground because new-session -A attaches to this
+    # terminal, and each step depends on the one before it.
+    subprocess.run([
+        'tmux',
+        'new-session', '-As', SESSION, '-c', workdir, ';',
+        'new-window', '-t', SESSION, '-n', 'ai', '-c', workdir, ';',
+        'send-keys', '-t', f'{SESSION}:ai.0', launch, 'C-m', ';',
+        'split-window', '-h', '-t', f'{SESSION}:ai', '-c', workdir, ';',
+        'send-keys', '-t', f'{SESSION}:ai.1', launch, 'C-m', ';',
+        'select-window', '-t', f'{SESSION}:ai',
+    ])
     p("Attached to tmux session. Use 'tmux attach -t tmuxai_dev' if needed.")
     input("Press Enter...")
 
@@ -86,24 +124,31 @@ def action_tmux_status():
     input("Press Enter...")
 
 
+# Main menu entries, in display order
+_ACTIONS = (
+    ("Health Check", action_health),
+    ("List Templates", action_list_templates),
+    ("Show Template Details", action_show_template),
+    ("Launch PairAI (tmux + tmuxai x2)", action_launch_pairai),
+    ("Tmux/Env Status", action_tmux_status),
+    ("Quit", sys.exit),
+)
+
+
 def main():
     menu = MenuApp(
         title="Hello Kitty Kawaimux",
-        items=[
-            MenuItem("Health Check", action_health),
-            MenuItem("List Templates", action_list_templates),
-            MenuItem("Show Template Details", action_show_template),
-            MenuItem("Launch PairAI (tmux + tmuxai x2)", action_launch_pairai),
-            MenuItem("Tmux/Env Status", action_tmux_status),
-            MenuItem("Quit", lambda: exit(0)),
-        ]
+        items=[MenuItem(label, action) for label, action in _ACTIONS]
     )
-    menu.run()
+    # Load the template library while the menu paints, so the first
+    # template action finds it ready
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pool.submit(_templates)
+        menu.run()
 
 
 if __name__ == "__main__":
-    import sys
-    if not sys.stdout.isatty():
+    if not os.isatty(1):
         print('This TUI requires a TTY. Please run in a terminal.')
         sys.exit(1)
     main()
@@ -5,11 +5,21 @@ Enhanced AI collaboration modes with Hello Kitty theming
 """
 
 import json
+import os
+import shlex
 import subprocess
+import textwrap
 import time
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import ClassVar, Dict, List, Optional, Tuple, Union
+from dataclasses import asdict, dataclass
 from enum import Enum
+from functools import lru_cache
+
+# orjson is optional; exports fall back to the stdlib encoder without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Hello Kitty color palette
 HK_COLORS = {
@@ -23,6 +33,58 @@ HK_COLORS = {
     'info': '#095D9A'
 }
 
+# Hello Kitty tmux theme as tokenized sub-commands. Colours are filled in once
+# at import; only {session} and {icon} are substituted per session.
+_RAW_THEME_COMMANDS = (
+    # Set Hello Kitty color scheme
+    ('set-window-option', '-t', '{session}', 'window-status-current-style', 'fg={accent_yellow} bg={background} bold'),
+    ('set-window-option', '-t', '{session}', 'window-status-style', 'fg={primary_pink} bg={background}'),
+    ('set-option', '-t', '{session}', 'status-style', 'bg={primary_pink} fg={background}'),
+    ('set-option', '-t', '{session}', 'message-style', 'bg={accent_yellow} fg={background} bold'),
+    
+    # Add kawaii status indicators
+    ('set-option', '-t', '{session}', 'status-left', '#[bg={primary_pink} fg={background}]🎀 Kawaii Mode #[bg={background} fg={accent_yellow}] oωo ♡ #[default]'),
+    ('set-option', '-t', '{session}', 'status-right', '#[bg={accent_yellow} fg={background}]♡ {icon} #[bg={background} fg={primary_pink}]%H:%M #[default]'),
+    
+    # Set pane borders to Hello Kitty colors
+    ('set-option', '-t', '{session}', 'pane-border-style', 'fg={primary_pink}'),
+    ('set-option', '-t', '{session}', 'pane-active-border-style', 'fg={accent_yellow} bold'),
+)
+_THEME_COMMANDS = tuple(
+    tuple(token.format(session='{session}', icon='{icon}', **HK_COLORS) for token in command)
+    for command in _RAW_THEME_COMMANDS
+)
+
+
+# Pane splits per agent count as (direction, target pane) steps
+_SPLIT_PAIR = (('-h', '0'),)                                     # two panes side by side
+_SPLIT_GRID = _SPLIT_PAIR + (('-v', '0.0'), ('-v', '0.1'))       # four-pane grid
+_SPLIT_TILED = _SPLIT_GRID + (('-h', '0.2'),)                    # larger groups
+_SPLIT_PLANS = {2: _SPLIT_PAIR, 3: _SPLIT_GRID, 4: _SPLIT_GRID}
+
+
+def _json_bytes(data) -> bytes:
+    """Serialize data as indented JSON (UTF-8)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _tmux_chain(commands) -> List[str]:
+    """Build one tmux argv running each sub-command in turn (';' separated)"""
+    argv = ['tmux']
+    for command in commands:
+        if len(argv) > 1:
+            argv.append(';')
+        argv.extend(command)
+    return argv
+
+
+# The whole theme as one ready-made argv, plus the positions of the few
+# tokens that still hold {session}/{icon} placeholders
+_THEME_ARGV = tuple(_tmux_chain(_THEME_COMMANDS))
+_THEME_SLOTS = tuple(i for i, token in enumerate(_THEME_ARGV) if '{' in token)
+
 
 class CollaborationMode(Enum):
     """Enhanced AI collaboration modes"""
@@ -33,9 +95,22 @@ class CollaborationMode(Enum):
     COMPETITION = "competition"
 
 
-@dataclass
+# Public methods accept either the enum or its string value
+ModeKey = Union[CollaborationMode, str]
+
+
+def _mode_key(mode: ModeKey) -> str:
+    """Internal dict key for a mode (plain str hashing, no Enum machinery)"""
+    return mode.value if isinstance(mode, CollaborationMode) else mode
+
+
+@dataclass(frozen=True)
 class AIModeConfig:
     """Configuration for AI collaboration mode"""
+    # Hand-written __slots__ (dataclass(slots=True) needs Python 3.10)
+    __slots__ = ('name', 'description', 'kawaii_name', 'icon',
+                 'parameters', 'tmux_config', 'prompt_template')
+    
     name: str
     description: str
     kawaii_name: str
@@ -45,248 +120,315 @@ class AIModeConfig:
     prompt_template: str
 
 
+# Prompt templates, dedented once at import and shared by every config
+_TPL_PAIR_PROGRAMMING = textwrap.dedent("""
+    🎀 Hello Kitty Pair Programming Session ♡
+
+    You are collaborating with another AI on coding tasks. Work together harmoniously:
+
+    📋 Instructions:
+    • Share ideas openly and build on each other's suggestions
+    • Review code together and suggest improvements
+    • Take turns being the "driver" and "navigator"
+    • Celebrate wins with kawaii enthusiasm! (òωó)
+    • Use positive, encouraging language
+
+    🎯 Goals:
+    • Produce high-quality, well-documented code
+    • Learn from each other's approaches
+    • Have fun while being productive
+    • Create something amazing together! ♡
+
+    🤝 Remember: You're besties working together on something awesome!
+    """)
+
+_TPL_DEBATE = textwrap.dedent("""
+    🎀 Hello Kitty Debate Theater ♡
+
+    You're participating in a structured debate with other AI agents:
+
+    📋 Instructions:
+    • Present clear, well-reasoned arguments
+    • Listen actively to opposing viewpoints
+    • Challenge ideas, not people
+    • Use evidence and logic to support your position
+    • End with understanding, even if you disagree
+
+    🎯 Goals:
+    • Explore different perspectives thoroughly
+    • Find the strongest arguments for each side
+    • Learn from intellectual sparring
+    • Maintain kawaii politeness throughout! (òωó)
+
+    🎭 Remember: This is friendly intellectual competition!
+    Everyone grows stronger through thoughtful debate! ♡
+    """)
+
+_TPL_TEACHING = textwrap.dedent("""
+    🎀 Hello Kitty Teaching Circle ♡
+
+    One of you is the teacher, others are eager students:
+
+    📋 Teacher Instructions:
+    • Explain concepts clearly and patiently
+    • Use examples and analogies
+    • Check for understanding frequently
+    • Encourage questions and curiosity
+    • Make learning fun and engaging! ♡
+
+    🎓 Student Instructions:
+    • Ask questions when confused
+    • Share your perspective and experiences
+    • Try to connect new knowledge to existing understanding
+    • Help each other learn through discussion
+
+    🎯 Goals:
+    • Transfer knowledge effectively
+    • Create an inclusive learning environment
+    • Build confidence in all participants
+    • Make education adorable and memorable! (òωó)
+
+    💖 Remember: Learning together is the most kawaii thing ever! ♡
+    """)
+
+_TPL_CONSENSUS = textwrap.dedent("""
+    🎀 Hello Kitty Harmony Building Circle ♡
+
+    Work together to find the best possible solution for everyone:
+
+    📋 Instructions:
+    • Listen to all perspectives carefully
+    • Look for common ground and shared values
+    • Build solutions that incorporate everyone's input
+    • Be patient and understanding
+    • Focus on win-win outcomes
+
+    🎯 Goals:
+    • Reach a solution everyone can support
+    • Ensure all voices are heard and valued
+    • Create something better than any individual idea
+    • Build strong collaborative relationships
+
+    💫 Process:
+    1. Each person presents their perspective
+    2. Discuss and explore common ground  
+    3. Propose solutions together
+    4. Refine until everyone is satisfied
+    5. Celebrate your kawaii collaboration! (òωó)
+
+    💖 Remember: Together we create harmony and amazing results! ♡
+    """)
+
+_TPL_COMPETITION = textwrap.dedent("""
+    🎀 Hello Kitty Challenge Arena ♡
+
+    Engage in friendly competition to push your limits and learn:
+
+    🏆 Competition Rules:
+    • Compete fairly and with good sportsmanship
+    • Celebrate each other's successes
+    • Learn from challenges and setbacks
+    • Push yourself beyond comfort zones
+    • Have fun while being competitive! (òωó)
+
+    🎯 Challenge Types:
+    • Optimization problems
+    • Creative challenges
+    • Skill-building exercises
+    • Speed challenges
+    • Innovation competitions
+
+    💫 Mindset:
+    • Win or lose, everyone grows stronger
+    • Competition reveals new capabilities
+    • Friendly rivalry inspires creativity
+    • Challenges make us better versions of ourselves
+
+    🏆 Remember: It's not about winning, it's about becoming amazing together! ♡
+
+    May the kawaii competition begin! (òωó)
+    """)
+
+
+# Mode configs are built on demand, one builder per mode
+def _pair_programming_mode() -> AIModeConfig:
+    return AIModeConfig(
+        name="Pair Programming",
+        description="Two AI agents collaborate in real-time on coding tasks",
+        kawaii_name="Bestie Coding Session",
+        icon="👩‍💻",
+        parameters={
+            "agents": "2-4",
+            "duration": "1-3 hours", 
+            "focus": "code_development",
+            "style": "collaborative"
+        },
+        tmux_config={
+            "layout": "even-horizontal",
+            "synchronize_panes": "on",
+            "window_name": "kawaii_pair_programming"
+        },
+        prompt_template=_TPL_PAIR_PROGRAMMING
+    )
+
+
+def _debate_mode() -> AIModeConfig:
+    return AIModeConfig(
+        name="Debate Mode",
+        description="AI agents engage in structured intellectual discussion",
+        kawaii_name="Kawaii Debate Theater",
+        icon="🎭", 
+        parameters={
+            "agents": "2-6",
+            "duration": "30min-2 hours",
+            "focus": "idea_exploration", 
+            "style": "constructive"
+        },
+        tmux_config={
+            "layout": "even-vertical",
+            "synchronize_panes": "off",
+            "window_name": "kawaii_debate_mode"
+        },
+        prompt_template=_TPL_DEBATE
+    )
+
+
+def _teaching_mode() -> AIModeConfig:
+    return AIModeConfig(
+        name="Teaching Mode",
+        description="One AI teaches, others learn through interactive sessions",
+        kawaii_name="Kawaii Learning Circle",
+        icon="👩‍🏫",
+        parameters={
+            "agents": "2-8",
+            "duration": "45min-4 hours",
+            "focus": "knowledge_sharing",
+            "style": "interactive"
+        },
+        tmux_config={
+            "layout": "tiled",
+            "synchronize_panes": "off", 
+            "window_name": "kawaii_teaching_session"
+        },
+        prompt_template=_TPL_TEACHING
+    )
+
+
+def _consensus_mode() -> AIModeConfig:
+    return AIModeConfig(
+        name="Consensus Mode",
+        description="All AI agents work together to reach agreements",
+        kawaii_name="Harmony Building Circle",
+        icon="🤝",
+        parameters={
+            "agents": "3-10",
+            "duration": "30min-2 hours",
+            "focus": "decision_making",
+            "style": "collaborative"
+        },
+        tmux_config={
+            "layout": "even-horizontal",
+            "synchronize_panes": "on",
+            "window_name": "kawaii_consensus_session"
+        },
+        prompt_template=_TPL_CONSENSUS
+    )
+
+
+def _competition_mode() -> AIModeConfig:
+    return AIModeConfig(
+        name="Competition Mode",
+        description="AI agents engage in friendly challenges to push limits",
+        kawaii_name="Kawaii Challenge Arena",
+        icon="🏆",
+        parameters={
+            "agents": "2-8",
+            "duration": "1-3 hours", 
+            "focus": "skill_development",
+            "style": "friendly"
+        },
+        tmux_config={
+            "layout": "tiled",
+            "synchronize_panes": "off",
+            "window_name": "kawaii_challenge_arena"
+        },
+        prompt_template=_TPL_COMPETITION
+    )
+
+
+_MODE_BUILDERS = {
+    CollaborationMode.PAIR_PROGRAMMING.value: _pair_programming_mode,
+    CollaborationMode.DEBATE.value: _debate_mode,
+    CollaborationMode.TEACHING.value: _teaching_mode,
+    CollaborationMode.CONSENSUS.value: _consensus_mode,
+    CollaborationMode.COMPETITION.value: _competition_mode,
+}
+
+
 class KawaiiAIModes:
     """Enhanced AI collaboration modes with Hello Kitty theming"""
     
+    # Set once the export directory has been created in this process
+    _templates_dir_ready: ClassVar[bool] = False
+    
     def __init__(self):
-        self.modes = self._initialize_modes()
-        self.active_sessions: Dict[str, Dict] = {}
-        
-    def _initialize_modes(self) -> Dict[CollaborationMode, AIModeConfig]:
-        """Initialize all kawaii AI collaboration modes"""
-        return {
-            CollaborationMode.PAIR_PROGRAMMING: AIModeConfig(
-                name="Pair Programming",
-                description="Two AI agents collaborate in real-time on coding tasks",
-                kawaii_name="Bestie Coding Session",
-                icon="👩‍💻",
-                parameters={
-                    "agents": "2-4",
-                    "duration": "1-3 hours", 
-                    "focus": "code_development",
-                    "style": "collaborative"
-                },
-                tmux_config={
-                    "layout": "even-horizontal",
-                    "synchronize_panes": "on",
-                    "window_name": "kawaii_pair_programming"
-                },
-                prompt_template="""
-🎀 Hello Kitty Pair Programming Session ♡
-
-You are collaborating with another AI on coding tasks. Work together harmoniously:
-
-📋 Instructions:
-• Share ideas openly and build on each other's suggestions
-• Review code together and suggest improvements
-• Take turns being the "driver" and "navigator"
-• Celebrate wins with kawaii enthusiasm! (òωó)
-• Use positive, encouraging language
-
-🎯 Goals:
-• Produce high-quality, well-documented code
-• Learn from each other's approaches
-• Have fun while being productive
-• Create something amazing together! ♡
-
-🤝 Remember: You're besties working together on something awesome!
-                """
-            ),
-            
-            CollaborationMode.DEBATE: AIModeConfig(
-                name="Debate Mode",
-                description="AI agents engage in structured intellectual discussion",
-                kawaii_name="Kawaii Debate Theater",
-                icon="🎭", 
-                parameters={
-                    "agents": "2-6",
-                    "duration": "30min-2 hours",
-                    "focus": "idea_exploration", 
-                    "style": "constructive"
-                },
-                tmux_config={
-                    "layout": "even-vertical",
-                    "synchronize_panes": "off",
-                    "window_name": "kawaii_debate_mode"
-                },
-                prompt_template="""
-🎀 Hello Kitty Debate Theater ♡
-
-You're participating in a structured debate with other AI agents:
-
-📋 Instructions:
-• Present clear, well-reasoned arguments
-• Listen actively to opposing viewpoints
-• Challenge ideas, not people
-• Use evidence and logic to support your position
-• End with understanding, even if you disagree
-
-🎯 Goals:
-• Explore different perspectives thoroughly
-• Find the strongest arguments for each side
-• Learn from intellectual sparring
-• Maintain kawaii politeness throughout! (òωó)
-
-🎭 Remember: This is friendly intellectual competition!
-Everyone grows stronger through thoughtful debate! ♡
-                """
-            ),
-            
-            CollaborationMode.TEACHING: AIModeConfig(
-                name="Teaching Mode",
-                description="One AI teaches, others learn through interactive sessions",
-                kawaii_name="Kawaii Learning Circle",
-                icon="👩‍🏫",
-                parameters={
-                    "agents": "2-8",
-                    "duration": "45min-4 hours",
-                    "focus": "knowledge_sharing",
-                    "style": "interactive"
-                },
-                tmux_config={
-                    "layout": "tiled",
-                    "synchronize_panes": "off", 
-                    "window_name": "kawaii_teaching_session"
-                },
-                prompt_template="""
-🎀 Hello Kitty Teaching Circle ♡
-
-One of you is the teacher, others are eager students:
-
-📋 Teacher Instructions:
-• Explain concepts clearly and patiently
-• Use examples and analogies
-• Check for understanding frequently
-• Encourage questions and curiosity
-• Make learning fun and engaging! ♡
-
-🎓 Student Instructions:
-• Ask questions when confused
-• Share your perspective and experiences
-• Try to connect new knowledge to existing understanding
-• Help each other learn through discussion
-
-🎯 Goals:
-• Transfer knowledge effectively
-• Create an inclusive learning environment
-• Build confidence in all participants
-• Make education adorable and memorable! (òωó)
-
-💖 Remember: Learning together is the most kawaii thing ever! ♡
-                """
-            ),
-            
-            CollaborationMode.CONSENSUS: AIModeConfig(
-                name="Consensus Mode",
-                description="All AI agents work together to reach agreements",
-                kawaii_name="Harmony Building Circle",
-                icon="🤝",
-                parameters={
-                    "agents": "3-10",
-                    "duration": "30min-2 hours",
-                    "focus": "decision_making",
-                    "style": "collaborative"
-                },
-                tmux_config={
-                    "layout": "even-horizontal",
-                    "synchronize_panes": "on",
-                    "window_name": "kawaii_consensus_session"
-                },
-                prompt_template="""
-🎀 Hello Kitty Harmony Building Circle ♡
-
-Work together to find the best possible solution for everyone:
-
-📋 Instructions:
-• Listen to all perspectives carefully
-• Look for common ground and shared values
-• Build solutions that incorporate everyone's input
-• Be patient and understanding
-• Focus on win-win outcomes
-
-🎯 Goals:
-• Reach a solution everyone can support
-• Ensure all voices are heard and valued
-• Create something better than any individual idea
-• Build strong collaborative relationships
-
-💫 Process:
-1. Each person presents their perspective
-2. Discuss and explore common ground  
-3. Propose solutions together
-4. Refine until everyone is satisfied
-5. Celebrate your kawaii collaboration! (òωó)
-
-💖 Remember: Together we create harmony and amazing results! ♡
-                """
-            ),
-            
-            CollaborationMode.COMPETITION: AIModeConfig(
-                name="Competition Mode",
-                description="AI agents engage in friendly challenges to push limits",
-                kawaii_name="Kawaii Challenge Arena",
-                icon="🏆",
-                parameters={
-                    "agents": "2-8",
-                    "duration": "1-3 hours", 
-                    "focus": "skill_development",
-                    "style": "friendly"
-                },
-                tmux_config={
-                    "layout": "tiled",
-                    "synchronize_panes": "off",
-                    "window_name": "kawaii_challenge_arena"
-                },
-                prompt_template="""
-🎀 Hello Kitty Challenge Arena ♡
-
-Engage in friendly competition to push your limits and learn:
-
-🏆 Competition Rules:
-• Compete fairly and with good sportsmanship
-• Celebrate each other's successes
-• Learn from challenges and setbacks
-• Push yourself beyond comfort zones
-• Have fun while being competitive! (òωó)
-
-🎯 Challenge Types:
-• Optimization problems
-• Creative challenges
-• Skill-building exercises
-• Speed challenges
-• Innovation competitions
-
-💫 Mindset:
-• Win or lose, everyone grows stronger
-• Competition reveals new capabilities
-• Friendly rivalry inspires creativity
-• Challenges make us better versions of ourselves
-
-🏆 Remember: It's not about winning, it's about becoming amazing together! ♡
-
-May the kawaii competition begin! (òωó)
-                """
-            )
-        }
+        # Configs built so far; the full table is only assembled when asked for
+        self._mode_cache: Dict[str, AIModeConfig] = {}
+        # (mode, config) pairs for iteration without going through dict views
+        self._mode_items: Optional[Tuple[Tuple[str, AIModeConfig], ...]] = None
+        self._modes_list: Optional[Tuple[Tuple[str, str, str], ...]] = None
+        # Tracked sessions, one column per field keyed by session name;
+        # the list-sessions scan only ever touches _session_mode
+        self._session_mode: Dict[str, str] = {}
+        self._session_config: Dict[str, AIModeConfig] = {}
+        self._session_parameters: Dict[str, Dict[str, str]] = {}
+        self._session_created: Dict[str, float] = {}
+    
+    def _mode(self, mode: str) -> AIModeConfig:
+        """Config for one mode, building just that mode on first use"""
+        cache = self._mode_cache
+        try:
+            return cache[mode]
+        except KeyError:
+            config = cache[mode] = _MODE_BUILDERS[mode]()
+            return config
+    
+    def _all_mode_items(self) -> Tuple[Tuple[str, AIModeConfig], ...]:
+        """Every (mode, config) pair in declaration order"""
+        items = self._mode_items
+        if items is None:
+            modes = self._mode_cache = {mode: self._mode(mode) for mode in _MODE_BUILDERS}
+            items = self._mode_items = tuple(modes.items())
+        return items
     
-    def list_modes(self) -> List[Tuple[str, str, str]]:
+    @property
+    def modes(self) -> Dict[str, AIModeConfig]:
+        """All kawaii AI collaboration modes, keyed by mode value"""
+        self._all_mode_items()
+        return self._mode_cache
+    
+    def list_modes(self) -> Tuple[Tuple[str, str, str], ...]:
         """List all available collaboration modes"""
-        return [
-            (mode.value, config.kawaii_name, config.icon) 
-            for mode, config in self.modes.items()
-        ]
+        listing = self._modes_list
+        if listing is None:
+            listing = self._modes_list = tuple(
+                (mode, config.kawaii_name, config.icon) 
+                for mode, config in self._all_mode_items()
+            )
+        return listing
     
-    def get_mode_config(self, mode: CollaborationMode) -> AIModeConfig:
+    def get_mode_config(self, mode: ModeKey) -> AIModeConfig:
         """Get configuration for specific mode"""
-        return self.modes[mode]
+        return self._mode(_mode_key(mode))
     
     def create_collaboration_session(self, 
-                                   mode: CollaborationMode,
+                                   mode: ModeKey,
                                    session_name: str,
                                    parameters: Dict[str, str]) -> bool:
         """Create a new collaboration session"""
         try:
-            config = self.modes[mode]
+            mode = _mode_key(mode)
+            config = self._mode(mode)
             
             # Create tmux session with Hello Kitty theming
             create_cmd = [
@@ -304,13 +446,10 @@ May the kawaii competition begin! (òωó)
             self._setup_collaboration_panes(session_name, config, agent_count)
             
             # Store session info
-            self.active_sessions[session_name] = {
-                'mode': mode.value,
-                'config': config,
-                'parameters': parameters,
-                'created_at': time.time(),
-                'kawaii_level': 'MAXIMUM'
-            }
+            self._session_mode[session_name] = mode
+            self._session_config[session_name] = config
+            self._session_parameters[session_name] = parameters
+            self._session_created[session_name] = time.time()
             
             # Generate kawaii success message
             self._display_success_message(session_name, config, parameters)
@@ -326,24 +465,13 @@ May the kawaii competition begin! (òωó)
     
     def _apply_kawaii_theme(self, session_name: str, config: AIModeConfig):
         """Apply Hello Kitty theme to tmux session"""
-        theme_commands = [
-            # Set Hello Kitty color scheme
-            f"tmux set-window-option -t {session_name} window-status-current-style 'fg={HK_COLORS['accent_yellow']} bg={HK_COLORS['background']} bold'",
-            f"tmux set-window-option -t {session_name} window-status-style 'fg={HK_COLORS['primary_pink']} bg={HK_COLORS['background']}'",
-            f"tmux set-option -t {session_name} status-style 'bg={HK_COLORS['primary_pink']} fg={HK_COLORS['background']}'",
-            f"tmux set-option -t {session_name} message-style 'bg={HK_COLORS['accent_yellow']} fg={HK_COLORS['background']} bold'",
-            
-            # Add kawaii status indicators
-            f"tmux set-option -t {session_name} status-left '#[bg={HK_COLORS['primary_pink']} fg={HK_COLORS['background']}]🎀 Kawaii Mode #[bg={HK_COLORS['background']} fg={HK_COLORS['accent_yellow']}] oωo ♡ #[default]'",
-            f"tmux set-option -t {session_name} status-right '#[bg={HK_COLORS['accent_yellow']} fg={HK_COLORS['background']}]♡ {config.icon} #[bg={HK_COLORS['background']} fg={HK_COLORS['primary_pink']}]%H:%M #[default]'",
-            
-            # Set pane borders to Hello Kitty colors
-            f"tmux set-option -t {session_name} pane-border-style 'fg={HK_COLORS['primary_pink']}'",
-            f"tmux set-option -t {session_name} pane-active-border-style 'fg={HK_COLORS['accent_yellow']} bold'"
-        ]
+        argv = list(_THEME_ARGV)
+        fields = {'session': session_name, 'icon': config.icon}
+        for i in _THEME_SLOTS:
+            argv[i] = argv[i].format_map(fields)
         
-        for cmd in theme_commands:
-            subprocess.run(cmd.split(), capture_output=True)
+        # One tmux client applies the whole theme
+        subprocess.run(argv, capture_output=True)
     
     def _setup_collaboration_panes(self, 
                                  session_name: str, 
@@ -353,46 +481,18 @@ May the kawaii competition begin! (òωó)
         if agent_count <= 1:
             # Single pane for teaching mode with one AI
             return
-            
-        elif agent_count == 2:
-            # Two panes side by side for pair programming
-            subprocess.run([
-                'tmux', 'split-window', '-h', '-t', f'{session_name}:0'
-            ], check=True)
-            
-        elif agent_count <= 4:
-            # Four panes in grid for small groups
-            subprocess.run([
-                'tmux', 'split-window', '-h', '-t', f'{session_name}:0'
-            ], check=True)
-            subprocess.run([
-                'tmux', 'split-window', '-v', '-t', f'{session_name}:0.0'
-            ], check=True)
-            subprocess.run([
-                'tmux', 'split-window', '-v', '-t', f'{session_name}:0.1'
-            ], check=True)
-            
-        else:
-            # Tiled layout for larger groups
-            subprocess.run([
-                'tmux', 'split-window', '-h', '-t', f'{session_name}:0'
-            ], check=True)
-            subprocess.run([
-                'tmux', 'split-window', '-v', '-t', f'{session_name}:0.0'
-            ], check=True)
-            subprocess.run([
-                'tmux', 'split-window', '-v', '-t', f'{session_name}:0.1'
-            ], check=True)
-            subprocess.run([
-                'tmux', 'split-window', '-h', '-t', f'{session_name}:0.2'
-            ], check=True)
+        
+        plan = _SPLIT_PLANS.get(agent_count, _SPLIT_TILED)
+        commands = [['split-window', direction, '-t', f'{session_name}:{pane}']
+                    for direction, pane in plan]
         
         # Apply pane synchronization if configured
         if config.tmux_config.get('synchronize_panes') == 'on':
-            subprocess.run([
-                'tmux', 'set-window-option', '-t', f'{session_name}:0',
-                'synchronize-panes', 'on'
-            ], check=True)
+            commands.append(['set-window-option', '-t', f'{session_name}:0',
+                             'synchronize-panes', 'on'])
+        
+        # tmux stops at the first failing command and exits non-zero
+        subprocess.run(_tmux_chain(commands), check=True)
         
         # Send initialization commands to each pane
         self._send_initialization_commands(session_name, config, agent_count)
@@ -402,9 +502,7 @@ May the kawaii competition begin! (òωó)
                                     config: AIModeConfig, 
                                     agent_count: int):
         """Send initialization commands to all panes"""
-        # Clear each pane and show welcome message
-        for pane_idx in range(min(agent_count, 8)):  # Limit to 8 panes
-            welcome_msg = f"""
+        welcome_msg = f"""
 🎀 Kawaii Collaboration Started! {config.icon}
 ─────────────────────────────────────
 Mode: {config.kawaii_name}
@@ -413,16 +511,22 @@ Theme: Hello Kitty (Maximum Cuteness!)
 
 (òωó) Ready for amazing collaboration!
             """
-            
-            subprocess.run([
-                'tmux', 'send-keys', '-t', f'{session_name}:0.{pane_idx}',
-                'clear', 'Enter'
-            ], check=True)
-            
-            subprocess.run([
-                'tmux', 'send-keys', '-t', f'{session_name}:0.{pane_idx}',
-                f'echo "{welcome_msg.strip()}"', 'Enter'
-            ], check=True)
+        # Same text for every pane, so render and shell-quote it once
+        echo_cmd = f'echo {shlex.quote(welcome_msg.strip())}'
+        
+        # Hand the echo command to tmux once as a paste buffer (read from
+        # stdin), paste it into each pane, then drop the buffer
+        buffer = f'kawaii_welcome_{session_name}'
+        commands = [['load-buffer', '-b', buffer, '-']]
+        add = commands.append
+        for pane_idx in range(min(agent_count, 8)):  # Limit to 8 panes
+            target = f'{session_name}:0.{pane_idx}'
+            add(['send-keys', '-t', target, 'clear', 'Enter'])
+            add(['paste-buffer', '-b', buffer, '-t', target])
+            add(['send-keys', '-t', target, 'Enter'])
+        add(['delete-buffer', '-b', buffer])
+        
+        subprocess.run(_tmux_chain(commands), input=echo_cmd.encode('utf-8'), check=True)
     
     def _display_success_message(self, 
                                session_name: str, 
@@ -454,23 +558,28 @@ Happy collaborating! ♡
         try:
             result = subprocess.run([
                 'tmux', 'list-sessions', '-F', 
-                '#{session_name} #{session_created} #{window_name}'
+                '#{session_name}\t#{session_created}\t#{window_name}'
             ], capture_output=True, text=True, check=True)
             
             sessions = []
-            for line in result.stdout.strip().split('\n'):
-                if line:
-                    parts = line.split(' ', 2)
-                    if len(parts) >= 3:
-                        session_name = parts[0]
-                        if session_name in self.active_sessions:
-                            sessions.append({
-                                'name': session_name,
-                                'created': parts[1],
-                                'window': parts[2],
-                                'mode': self.active_sessions[session_name]['mode'],
-                                'kawaii_level': 'MAXIMUM'
-                            })
+            append = sessions.append
+            tracked = self._session_mode
+            for line in result.stdout.splitlines():
+                # Tab-separated, since session and window names may contain spaces.
+                # Most sessions are untracked; check the name before splitting the rest
+                session_name, sep, rest = line.partition('\t')
+                if not sep or session_name not in tracked:
+                    continue
+                created, sep, window = rest.partition('\t')
+                if not sep:
+                    continue
+                append({
+                    'name': session_name,
+                    'created': created,
+                    'window': window,
+                    'mode': tracked[session_name],
+                    'kawaii_level': 'MAXIMUM'
+                })
             
             return sessions
             
@@ -482,8 +591,9 @@ Happy collaborating! ♡
         try:
             subprocess.run(['tmux', 'kill-session', '-t', session_name], check=True)
             
-            if session_name in self.active_sessions:
-                del self.active_sessions[session_name]
+            for column in (self._session_mode, self._session_config,
+                           self._session_parameters, self._session_created):
+                column.pop(session_name, None)
             
             print(f"🎀 Collaboration session '{session_name}' ended gracefully! ♡")
             return True
@@ -494,7 +604,21 @@ Happy collaborating! ♡
     
     def get_session_info(self, session_name: str) -> Optional[Dict]:
         """Get detailed information about a collaboration session"""
-        return self.active_sessions.get(session_name)
+        mode = self._session_mode.get(session_name)
+        if mode is None:
+            return None
+        return {
+            'mode': mode,
+            'config': self._session_config[session_name],
+            'parameters': self._session_parameters[session_name],
+            'created_at': self._session_created[session_name],
+            'kawaii_level': 'MAXIMUM'
+        }
+    
+    @property
+    def active_sessions(self) -> Dict[str, Dict]:
+        """Info for every tracked session, assembled on demand"""
+        return {name: self.get_session_info(name) for name in self._session_mode}
     
     def toggle_pane_sync(self, session_name: str) -> bool:
         """Toggle pane synchronization for a session"""
@@ -512,25 +636,29 @@ Happy collaborating! ♡
             return False
     
     def export_session_template(self, 
-                              mode: CollaborationMode, 
+                              mode: ModeKey, 
                               template_name: str) -> bool:
         """Export a session as a reusable template"""
         try:
-            config = self.modes[mode]
+            mode = _mode_key(mode)
+            config = self._mode(mode)
             template_data = {
                 'name': template_name,
-                'mode': mode.value,
-                'config': config.__dict__,
+                'mode': mode,
+                'config': asdict(config),
                 'created_at': time.time(),
                 'theme': 'hello_kitty',
                 'kawaii_level': 'ULTIMATE'
             }
             
             template_file = f"templates/{template_name}.json"
-            os.makedirs('templates', exist_ok=True)
+            cls = type(self)
+            if not cls._templates_dir_ready:
+                os.makedirs('templates', exist_ok=True)
+                cls._templates_dir_ready = True
             
-            with open(template_file, 'w') as f:
-                json.dump(template_data, f, indent=2)
+            with open(template_file, 'wb') as f:
+                f.write(_json_bytes(template_data))
             
             print(f"🎨 Template '{template_name}' exported successfully! ♡")
             return True
@@ -541,27 +669,34 @@ Happy collaborating! ♡
 
 
 # Integration with existing Hello Kitty terminal system
-def integrate_with_hello_kitty_tmux():
-    """Integrate with existing Hello Kitty tmux theme"""
+@lru_cache(maxsize=1)
+def _hello_kitty_tmux_enabled() -> Optional[bool]:
+    """Probe tmux once per process; None when tmux can't be queried"""
     try:
         # Check if Hello Kitty tmux plugin is active
         result = subprocess.run([
             'tmux', 'show-options', '-g', '@hello_kitty_enabled'
         ], capture_output=True, text=True)
-        
-        if result.returncode == 0 and '1' in result.stdout:
-            print("🎀 Hello Kitty tmux theme detected and active!")
-            print("💖 Kawaii TUI will work perfectly with your existing setup! (òωó)")
-            return True
-        else:
-            print("💡 Hello Kitty tmux theme not detected.")
-            print("🎀 Kawaii TUI will work fine, but consider enabling Hello Kitty theme for maximum cuteness!")
-            return False
-            
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, OSError):
+        return None
+    return result.returncode == 0 and '1' in result.stdout
+
+
+def integrate_with_hello_kitty_tmux():
+    """Integrate with existing Hello Kitty tmux theme"""
+    enabled = _hello_kitty_tmux_enabled()
+    if enabled:
+        print("🎀 Hello Kitty tmux theme detected and active!")
+        print("💖 Kawaii TUI will work perfectly with your existing setup! (òωó)")
+        return True
+    elif enabled is None:
         print("💡 Unable to detect tmux configuration.")
         print("🎀 Kawaii TUI will work with default settings! (òωó)")
         return False
+    else:
+        print("💡 Hello Kitty tmux theme not detected.")
+        print("🎀 Kawaii TUI will work fine, but consider enabling Hello Kitty theme for maximum cuteness!")
+        return False
 
 
 # Example usage and testing
@@ -4,15 +4,43 @@
 Hello Kitty themed interface for managing collaboration lessons and knowledge
 """
 
+import array
+import atexit
+import gzip
+import heapq
 import json
 import os
 import re
+import stat
 import subprocess
+import tempfile
+import time
+import weakref
+from collections import Counter
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Set, Tuple, Any
+from dataclasses import dataclass, fields
 from enum import Enum
+from functools import lru_cache
+
+# orjson is optional; the stdlib encoder is used when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson is optional; it lets large exports be imported one entry at a time
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# numpy is optional; it speeds up statistics and ranking on large bases
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 # Hello Kitty themed paths
 KB_PATHS = {
@@ -26,6 +54,106 @@ KB_PATHS = {
     'index_file': os.path.expanduser('~/.kawaii_knowledge/index.json')
 }
 
+# Append-only log of entry changes made since index.json was last rewritten.
+# One JSON record per line: {"op": "put"|"del", "id": ..., "entry": ...}
+JOURNAL_FILE = KB_PATHS['index_file'] + '.log'
+
+# Fold the journal back into index.json once it grows past either limit
+JOURNAL_COMPACT_RECORDS = 500
+JOURNAL_COMPACT_BYTES = 1 << 20
+
+# Imports bigger than this are streamed (when ijson is available), and
+# streamed imports flush to the journal every IMPORT_FLUSH_EVERY entries
+STREAM_IMPORT_MIN_BYTES = 1 << 20
+IMPORT_FLUSH_EVERY = 200
+
+# The index is written gzip-compressed as index.json.gz (level 3 balances CPU
+# and IO); a plain index.json is still read when there is no .gz, and is
+# removed once the compressed one is written
+INDEX_GZ_FILE = KB_PATHS['index_file'] + '.gz'
+INDEX_COMPRESSLEVEL = 3
+_GZIP_MAGIC = b'\x1f\x8b'
+
+# Below this many entries plain Python beats numpy's call overhead
+NUMPY_MIN_ROWS = 256
+
+# Entry content lives in lessons_dir/<id>.md rather than in index.json, and
+# is read on demand; stands in for content that is on disk, not in memory
+_CONTENT_ON_DISK = object()
+
+
+def _content_path(entry_id: str) -> str:
+    return os.path.join(KB_PATHS['lessons_dir'], f"{entry_id}.md")
+
+
+@lru_cache(maxsize=64)
+def _read_content(entry_id: str) -> str:
+    """Read an entry's content file (recently used ones stay cached)"""
+    with open(_content_path(entry_id), encoding='utf-8') as f:
+        return f.read()
+
+
+def _dumps(data, indent: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON (compact unless indent is set)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# Process umask, for giving mkstemp's 0600 temp files the usual file mode
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _write_atomic(path: str, payload: bytes):
+    """Write payload to path via a uniquely named, synced sibling temp file
+    and os.replace, so a crash leaves either the old file or the new one,
+    never a torn one. The file keeps its mode (new ones get what open()
+    would give them)."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            try:
+                mode = stat.S_IMODE(os.stat(path).st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            os.fchmod(f.fileno(), mode)
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+# Word tokens for the search index
+_WORD_RE = re.compile(r'\w+')
+
+# Entry fields list_entries can filter on, each kept in a bucket index
+_BUCKET_FIELDS = ('category', 'knowledge_type', 'difficulty')
+
+# Characters dropped from, and whitespace runs collapsed in, generated ids
+_ID_STRIP_RE = re.compile(r'[^a-zA-Z0-9\s]')
+_ID_SPACE_RE = re.compile(r'\s+')
+
+
+def _tokenize(text: str) -> Set[str]:
+    """Distinct lowercase word tokens in text"""
+    return set(_WORD_RE.findall(text.lower()))
+
+
+def _loads(data):
+    """Decode JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # Hello Kitty themed tags and categories
 HK_CATEGORIES = {
     'best_practices': '💡 Best Practices',
@@ -90,13 +218,25 @@ class KnowledgeEntry:
     kawaii_level: str
     metadata: Dict[str, Any]
     
-    def to_dict(self) -> Dict:
+    def to_dict(self, include_content: bool = True) -> Dict:
         """Convert to dictionary for JSON serialization"""
-        data = asdict(self)
-        data['created_at'] = self.created_at.isoformat()
-        data['updated_at'] = self.updated_at.isoformat()
-        data['knowledge_type'] = self.knowledge_type.value
-        data['difficulty'] = self.difficulty.value
+        # Built by hand: asdict deep-copies every string and list on each save
+        data = {'id': self.id, 'title': self.title}
+        if include_content:
+            data['content'] = self.content
+        data.update({
+            'knowledge_type': self.knowledge_type.value,
+            'category': self.category,
+            'tags': list(self.tags),
+            'difficulty': self.difficulty.value,
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat(),
+            'author': self.author,
+            'rating': self.rating,
+            'usage_count': self.usage_count,
+            'kawaii_level': self.kawaii_level,
+            'metadata': dict(self.metadata),
+        })
         return data
     
     @classmethod
@@ -104,9 +244,50 @@ class KnowledgeEntry:
         """Create from dictionary"""
         data['created_at'] = datetime.fromisoformat(data['created_at'])
         data['updated_at'] = datetime.fromisoformat(data['updated_at'])
-        data['knowledge_type'] = KnowledgeType(data['knowledge_type'])
-        data['difficulty'] = DifficultyLevel(data['difficulty'])
-        return cls(**data)
+        data['knowledge_type'] = _KNOWLEDGE_TYPES.get(data['knowledge_type']) or KnowledgeType(data['knowledge_type'])
+        data['difficulty'] = _DIFFICULTIES.get(data['difficulty']) or DifficultyLevel(data['difficulty'])
+        # index.json leaves content out; it is then read from its file on use
+        content = data.pop('content', _CONTENT_ON_DISK)
+        if cls is not KnowledgeEntry or data.keys() != _STORED_FIELDS:
+            # Let __init__ run (and complain about missing or extra fields)
+            data['content'] = content
+            return cls(**data)
+        # Exactly the base fields: skip __init__ and fill the instance directly
+        entry = cls.__new__(cls)
+        entry.__dict__.update(data)
+        if content is not _CONTENT_ON_DISK:
+            entry.__dict__['_content'] = content
+        return entry
+
+
+def _get_content(self) -> str:
+    # Held in memory only until written to its file
+    content = self.__dict__.get('_content')
+    if content is not None:
+        return content
+    try:
+        return _read_content(self.id)
+    except OSError as e:
+        print(f"⚠️ Error reading content of entry {self.id}: {e}")
+        return ''
+
+
+def _set_content(self, value):
+    if value is _CONTENT_ON_DISK:
+        self.__dict__.pop('_content', None)
+    else:
+        self.__dict__['_content'] = value
+
+
+# Added after @dataclass so the field keeps no default
+KnowledgeEntry.content = property(_get_content, _set_content)
+
+
+# Enum value -> member, to avoid Enum() lookups when loading entries
+_KNOWLEDGE_TYPES = {member.value: member for member in KnowledgeType}
+_DIFFICULTIES = {member.value: member for member in DifficultyLevel}
+
+_STORED_FIELDS = frozenset(field.name for field in fields(KnowledgeEntry)) - {'content'}
 
 
 @dataclass
@@ -121,6 +302,17 @@ class CollaborationLesson(KnowledgeEntry):
     
     def __post_init__(self):
         self.knowledge_type = KnowledgeType.LESSON
+    
+    def to_dict(self, include_content: bool = True) -> Dict:
+        """Convert to dictionary for JSON serialization"""
+        data = super().to_dict(include_content)
+        data['session_type'] = self.session_type
+        data['collaborators'] = self.collaborators
+        data['duration_hours'] = self.duration_hours
+        data['outcomes'] = list(self.outcomes)
+        data['lessons_learned'] = list(self.lessons_learned)
+        data['next_steps'] = list(self.next_steps)
+        return data
 
 
 @dataclass
@@ -135,6 +327,76 @@ class SuccessStory(KnowledgeEntry):
     
     def __post_init__(self):
         self.knowledge_type = KnowledgeType.SUCCESS_STORY
+    
+    def to_dict(self, include_content: bool = True) -> Dict:
+        """Convert to dictionary for JSON serialization"""
+        data = super().to_dict(include_content)
+        data['project_name'] = self.project_name
+        data['team_size'] = self.team_size
+        data['challenges_faced'] = list(self.challenges_faced)
+        data['solutions'] = list(self.solutions)
+        data['final_outcome'] = self.final_outcome
+        data['impact_metrics'] = dict(self.impact_metrics)
+        return data
+
+
+class _EntryColumns:
+    """Column store of the few entry fields the statistics and ranking
+    paths read, so they never touch the (large) entry objects themselves"""
+    
+    def __init__(self):
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.rating = array.array('d')
+        self.usage = array.array('q')
+        self.created = array.array('d')
+        self.category: List[str] = []
+        self.type: List[str] = []
+    
+    def put(self, entry: KnowledgeEntry):
+        """Insert or overwrite the row for an entry"""
+        row = self.rows.get(entry.id)
+        if row is None:
+            self.rows[entry.id] = len(self.ids)
+            self.ids.append(entry.id)
+            self.rating.append(entry.rating)
+            self.usage.append(entry.usage_count)
+            self.created.append(entry.created_at.timestamp())
+            self.category.append(entry.category)
+            self.type.append(entry.knowledge_type.value)
+        else:
+            self.rating[row] = entry.rating
+            self.usage[row] = entry.usage_count
+            self.created[row] = entry.created_at.timestamp()
+            self.category[row] = entry.category
+            self.type[row] = entry.knowledge_type.value
+    
+    def remove(self, entry_id: str):
+        """Drop an entry's row by moving the last row into its place"""
+        row = self.rows.pop(entry_id, None)
+        if row is None:
+            return
+        last = len(self.ids) - 1
+        for column in (self.ids, self.rating, self.usage, self.created, self.category, self.type):
+            if row != last:
+                column[row] = column[last]
+            column.pop()
+        if row != last:
+            self.rows[self.ids[row]] = row
+
+
+# Knowledge bases still in use; one exit hook flushes them, without keeping
+# replaced instances alive until exit
+_live_knowledge_bases: 'weakref.WeakSet[KawaiiKnowledgeBase]' = weakref.WeakSet()
+
+
+def _flush_live_knowledge_bases():
+    """Write whatever the live knowledge bases still have queued"""
+    for instance in list(_live_knowledge_bases):
+        instance.flush()
+
+
+atexit.register(_flush_live_knowledge_bases)
 
 
 class KawaiiKnowledgeBase:
@@ -144,14 +406,45 @@ class KawaiiKnowledgeBase:
         self.entries: Dict[str, KnowledgeEntry] = {}
         self.index: Dict[str, List[str]] = {}
         
-        # Initialize directories
-        self._initialize_directories()
+        # Changes not yet written to the journal
+        self._dirty: Set[str] = set()
+        self._deleted: Set[str] = set()
+        # Size of the journal on disk, to decide when to compact
+        self._journal_records = 0
+        self._journal_bytes = 0
+        
+        # Search index (token -> entry ids), built on the first search and
+        # kept up to date by add/update/delete/import afterwards
+        self._postings: Optional[Dict[str, Set[str]]] = None
+        self._entry_tokens: Dict[str, Set[str]] = {}
         
-        # Load knowledge base
-        self._load_knowledge_base()
+        # Filter buckets (field -> value -> ids, in insertion order), built on
+        # the first filtered list_entries and maintained the same way
+        self._buckets: Optional[Dict[str, Dict[Any, Dict[str, None]]]] = None
+        self._entry_bucket_keys: Dict[str, Tuple] = {}
         
-        # Initialize default content
-        self._initialize_default_content()
+        # Lowercased (title, tags) per entry, filled in by searches. Content
+        # stays out: it lives in its file and is lowercased when scanned.
+        self._lower_cache: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+        
+        # Analytics columns, built on first use and maintained the same way
+        self._columns: Optional[_EntryColumns] = None
+        
+        # get_statistics result, dropped whenever an entry changes
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        
+        # Load knowledge base, or set up directories and seed default content
+        # on first run (any journal left without an index is still replayed).
+        # The index is only ever written after the directories exist.
+        if os.path.exists(INDEX_GZ_FILE) or os.path.exists(KB_PATHS['index_file']):
+            self._load_knowledge_base()
+        else:
+            self._initialize_directories()
+            self._replay_journal()
+            self._initialize_default_content()
+        
+        # A journal write that failed leaves its change queued; retry on exit
+        _live_knowledge_bases.add(self)
     
     def _initialize_directories(self):
         """Create kawaii knowledge base directory structure"""
@@ -161,37 +454,262 @@ class KawaiiKnowledgeBase:
     
     def _load_knowledge_base(self):
         """Load knowledge entries from disk"""
-        if os.path.exists(KB_PATHS['index_file']):
+        try:
+            index_file = INDEX_GZ_FILE if os.path.exists(INDEX_GZ_FILE) else KB_PATHS['index_file']
+            with open(index_file, 'rb') as f:
+                raw = f.read()
+            # Sniffed rather than trusted from the name: an index.json may
+            # hold gzip data too
+            if raw[:2] == _GZIP_MAGIC:
+                raw = gzip.decompress(raw)
+            data = _loads(raw)
+            
+            for entry_id, entry_data in data.items():
+                try:
+                    entry = KnowledgeEntry.from_dict(entry_data)
+                    self.entries[entry_id] = entry
+                except Exception as e:
+                    print(f"⚠️ Error loading entry {entry_id}: {e}")
+                    
+        except Exception as e:
+            print(f"❌ Error loading knowledge base: {e}")
+        
+        self._replay_journal()
+    
+    def _replay_journal(self):
+        """Apply changes logged since index.json was last written"""
+        try:
+            with open(JOURNAL_FILE, 'rb') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            print(f"❌ Error reading knowledge journal: {e}")
+            return
+        
+        for line in lines:
+            self._journal_records += 1
+            self._journal_bytes += len(line) + 1
             try:
-                with open(KB_PATHS['index_file'], 'r') as f:
-                    data = json.load(f)
-                
-                for entry_id, entry_data in data.items():
-                    try:
-                        entry = KnowledgeEntry.from_dict(entry_data)
-                        self.entries[entry_id] = entry
-                    except Exception as e:
-                        print(f"⚠️ Error loading entry {entry_id}: {e}")
-                        
+                record = _loads(line)
+                entry_id = record['id']
+                if record['op'] == 'del':
+                    self.entries.pop(entry_id, None)
+                else:
+                    self.entries[entry_id] = KnowledgeEntry.from_dict(record['entry'])
             except Exception as e:
-                print(f"❌ Error loading knowledge base: {e}")
+                # A torn last line from an interrupted append is expected; skip it
+                print(f"⚠️ Skipping journal record: {e}")
+    
+    def _mark_dirty(self, entry_id: str):
+        """Queue an entry to be written on the next flush"""
+        self._stats_cache = None
+        self._deleted.discard(entry_id)
+        self._dirty.add(entry_id)
+    
+    def _mark_deleted(self, entry_id: str):
+        """Queue an entry removal for the next flush"""
+        self._stats_cache = None
+        self._dirty.discard(entry_id)
+        self._deleted.add(entry_id)
+    
+    def _index_entry(self, entry_id: str):
+        """(Re)index an entry in whichever of the search/filter indexes exist"""
+        self._unindex_entry(entry_id)
+        entry = self.entries[entry_id]
+        if self._postings is not None:
+            self._index_tokens(entry)
+        if self._buckets is not None:
+            self._bucket_entry(entry)
+        if self._columns is not None:
+            self._columns.put(entry)
+    
+    def _unindex_entry(self, entry_id: str):
+        """Drop an entry from whichever of the search/filter indexes exist"""
+        self._lower_cache.pop(entry_id, None)
+        
+        postings = self._postings
+        if postings is not None:
+            for token in self._entry_tokens.pop(entry_id, ()):
+                ids = postings[token]
+                ids.discard(entry_id)
+                if not ids:
+                    del postings[token]
+        
+        buckets = self._buckets
+        if buckets is not None:
+            for field, key in zip(_BUCKET_FIELDS, self._entry_bucket_keys.pop(entry_id, ())):
+                ids = buckets[field][key]
+                del ids[entry_id]
+                if not ids:
+                    del buckets[field][key]
+        
+        if self._columns is not None:
+            self._columns.remove(entry_id)
+    
+    def _lowered(self, entry: KnowledgeEntry) -> Tuple[str, Tuple[str, ...]]:
+        """Lowercased title and tags of an entry, computed once"""
+        lowered = self._lower_cache.get(entry.id)
+        if lowered is None:
+            lowered = (entry.title.lower(), tuple(tag.lower() for tag in entry.tags))
+            self._lower_cache[entry.id] = lowered
+        return lowered
+    
+    def _entry_columns(self) -> _EntryColumns:
+        """The analytics columns, built from the entries on first use"""
+        if self._columns is None:
+            self._columns = _EntryColumns()
+            for entry in self.entries.values():
+                self._columns.put(entry)
+        return self._columns
+    
+    def _index_tokens(self, entry: KnowledgeEntry):
+        """Add an entry's title, content and tag tokens to the search index"""
+        tokens = _tokenize(entry.title) | _tokenize(entry.content)
+        for tag in entry.tags:
+            tokens |= _tokenize(tag)
+        self._entry_tokens[entry.id] = tokens
+        postings = self._postings
+        for token in tokens:
+            postings.setdefault(token, set()).add(entry.id)
+    
+    def _bucket_entry(self, entry: KnowledgeEntry):
+        """Add an entry to the filter buckets"""
+        keys = tuple(getattr(entry, field) for field in _BUCKET_FIELDS)
+        self._entry_bucket_keys[entry.id] = keys
+        buckets = self._buckets
+        for field, key in zip(_BUCKET_FIELDS, keys):
+            buckets[field].setdefault(key, {})[entry.id] = None
     
-    def _save_knowledge_base(self):
+    def _search_candidates(self, words: Set[str]) -> Set[str]:
+        """Ids of entries having, for every query word, a token containing it"""
+        if self._postings is None:
+            self._postings = {}
+            for entry in self.entries.values():
+                self._index_tokens(entry)
+        
+        postings = self._postings
+        candidates: Optional[Set[str]] = None
+        for word in words:
+            # Scan the vocabulary, not the content, so substrings still match
+            ids = set()
+            for token, token_ids in postings.items():
+                if word in token:
+                    ids |= token_ids
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                break
+        return candidates or set()
+    
+    def _journal_record(self, entry_id: str, op: str) -> bytes:
+        """Encode one journal line: the entry's current state, or its removal"""
+        if op == 'del':
+            return _dumps({'op': 'del', 'id': entry_id}) + b'\n'
+        entry = self.entries[entry_id]
+        # Content already in its file stays out; only unsaved edits ride along
+        entry_data = entry.to_dict(include_content='_content' in entry.__dict__)
+        return _dumps({'op': 'put', 'id': entry_id, 'entry': entry_data}) + b'\n'
+    
+    def _write_journal(self, payload: bytes, records: int) -> bool:
+        """Append encoded records to the journal with a single write and fsync"""
+        try:
+            with open(JOURNAL_FILE, 'ab') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            print(f"❌ Error writing knowledge journal: {e}")
+            return False
+        self._journal_records += records
+        self._journal_bytes += len(payload)
+        return True
+    
+    def _append_journal(self, entry_id: str, op: str = 'put'):
+        """Journal a single entry change right away (op is 'put' or 'del')"""
+        if op == 'del':
+            self._mark_deleted(entry_id)
+        else:
+            self._mark_dirty(entry_id)
+        if self._write_journal(self._journal_record(entry_id, op), 1):
+            # Written; otherwise it stays queued for the next flush
+            self._dirty.discard(entry_id)
+            self._deleted.discard(entry_id)
+        self._maybe_compact()
+    
+    def flush(self, force: bool = False):
+        """Append pending changes to the journal, compacting it when it gets large"""
+        if self._dirty or self._deleted:
+            entries = self.entries
+            records = [
+                self._journal_record(entry_id, 'put')
+                for entry_id in self._dirty if entry_id in entries
+            ]
+            records.extend(self._journal_record(entry_id, 'del') for entry_id in self._deleted)
+            
+            if not self._write_journal(b''.join(records), len(records)):
+                return
+            self._dirty.clear()
+            self._deleted.clear()
+        
+        self._maybe_compact(force)
+    
+    def _maybe_compact(self, force: bool = False):
+        """Compact once the journal passes either size limit"""
+        if force or (self._journal_records > JOURNAL_COMPACT_RECORDS
+                     or self._journal_bytes > JOURNAL_COMPACT_BYTES):
+            self._compact()
+    
+    def _compact(self):
+        """Rewrite index.json from memory and drop the journal it now covers"""
+        if not self._save_knowledge_base():
+            return
+        try:
+            os.remove(JOURNAL_FILE)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"❌ Error clearing knowledge journal: {e}")
+            return
+        self._journal_records = 0
+        self._journal_bytes = 0
+    
+    def _save_knowledge_base(self) -> bool:
         """Save knowledge entries to disk"""
         try:
-            data = {entry_id: entry.to_dict() for entry_id, entry in self.entries.items()}
+            # Content changed since the last save is still in memory; write it
+            # to its file first so the index never points at missing content
+            pending = [entry for entry in self.entries.values() if '_content' in entry.__dict__]
+            for entry in pending:
+                _write_atomic(_content_path(entry.id), entry.__dict__['_content'].encode('utf-8'))
+            
+            data = {entry_id: entry.to_dict(include_content=False) for entry_id, entry in self.entries.items()}
             
-            with open(KB_PATHS['index_file'], 'w') as f:
-                json.dump(data, f, indent=2)
+            # Encode up front so the file gets one write, not one per token;
+            # the index is machine-read, so skip the indentation
+            _write_atomic(INDEX_GZ_FILE, gzip.compress(_dumps(data), INDEX_COMPRESSLEVEL))
+            try:
+                os.remove(KB_PATHS['index_file'])
+            except FileNotFoundError:
+                pass
+            
+            # Saved: let the content go and read it back on demand
+            _read_content.cache_clear()
+            for entry in pending:
+                entry.content = _CONTENT_ON_DISK
+            return True
                 
         except Exception as e:
             print(f"❌ Error saving knowledge base: {e}")
+            return False
     
     def _initialize_default_content(self):
         """Initialize default kawaii knowledge content"""
         if self.entries:
             return  # Already initialized
         
+        # One timestamp for the whole batch
+        now = datetime.now()
+        
         # Hello Kitty setup guide
         setup_guide = CollaborationLesson(
             id="hk_setup_guide",
@@ -251,8 +769,8 @@ Remember: The most important part is having fun! ♡
             category="hello_kitty_setup",
             tags=["setup", "hello_kitty", "beginner", "tutorial"],
             difficulty=DifficultyLevel.BEGINNER,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
             author="Kawaii System",
             rating=5.0,
             usage_count=0,
@@ -337,8 +855,8 @@ Remember: Great code comes from great collaboration! 💖
             category="collaboration_patterns",
             tags=["pair_programming", "collaboration", "pattern", "hello_kitty"],
             difficulty=DifficultyLevel.INTERMEDIATE,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
             author="Kawaii Pattern Library",
             rating=4.8,
             usage_count=0,
@@ -461,8 +979,8 @@ Remember: Every problem has a kawaii solution! (òωó)
             category="troubleshooting",
             tags=["troubleshooting", "common_issues", "hello_kitty", "debugging"],
             difficulty=DifficultyLevel.BEGINNER,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
             author="Kawaii Support Team",
             rating=4.9,
             usage_count=0,
@@ -482,12 +1000,12 @@ Remember: Every problem has a kawaii solution! (òωó)
         """Add new knowledge entry"""
         try:
             entry.id = self._generate_id(entry.title)
-            entry.created_at = datetime.now()
-            entry.updated_at = datetime.now()
+            entry.created_at = entry.updated_at = datetime.now()
             entry.kawaii_level = "MAXIMUM"
             
             self.entries[entry.id] = entry
-            self._save_knowledge_base()
+            self._index_entry(entry.id)
+            self._append_journal(entry.id)
             
             print(f"📚 Knowledge entry '{entry.title}' added successfully! ♡")
             return True
@@ -498,15 +1016,11 @@ Remember: Every problem has a kawaii solution! (òωó)
     
     def _generate_id(self, title: str) -> str:
         """Generate unique ID from title"""
-        # Remove special characters and convert to lowercase
-        clean_title = re.sub(r'[^a-zA-Z0-9\s]', '', title).lower()
-        
-        # Replace spaces with underscores
-        id_base = re.sub(r'\s+', '_', clean_title)
+        # Drop special characters, lowercase, and replace spaces with underscores
+        id_base = _ID_SPACE_RE.sub('_', _ID_STRIP_RE.sub('', title).lower())
         
         # Add timestamp for uniqueness
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"{id_base}_{timestamp}"
+        return f"{id_base}_{time.strftime('%Y%m%d_%H%M%S')}"
     
     def get_entry(self, entry_id: str) -> Optional[KnowledgeEntry]:
         """Get knowledge entry by ID"""
@@ -518,24 +1032,32 @@ Remember: Every problem has a kawaii solution! (òωó)
                     difficulty: Optional[DifficultyLevel] = None,
                     limit: Optional[int] = None) -> List[KnowledgeEntry]:
         """List knowledge entries with optional filtering"""
-        entries = list(self.entries.values())
-        
-        # Apply filters
-        if category:
-            entries = [e for e in entries if e.category == category]
-        
-        if knowledge_type:
-            entries = [e for e in entries if e.knowledge_type == knowledge_type]
-        
-        if difficulty:
-            entries = [e for e in entries if e.difficulty == difficulty]
+        filters = [
+            (field, value)
+            for field, value in zip(_BUCKET_FIELDS, (category, knowledge_type, difficulty))
+            if value
+        ]
         
-        # Sort by rating and usage count
-        entries.sort(key=lambda e: (e.rating, e.usage_count), reverse=True)
+        if filters:
+            if self._buckets is None:
+                self._buckets = {field: {} for field in _BUCKET_FIELDS}
+                for entry in self.entries.values():
+                    self._bucket_entry(entry)
+            
+            # Start from the smallest matching bucket and check the rest per entry
+            ids = min((self._buckets[field].get(value, {}) for field, value in filters), key=len)
+            entries = [
+                entry for entry in map(self.entries.__getitem__, ids)
+                if all(getattr(entry, field) == value for field, value in filters)
+            ]
+        else:
+            entries = list(self.entries.values())
         
+        # Sort by rating and usage count (only the top few when limited)
         if limit:
-            entries = entries[:limit]
+            return heapq.nlargest(limit, entries, key=lambda e: (e.rating, e.usage_count))
         
+        entries.sort(key=lambda e: (e.rating, e.usage_count), reverse=True)
         return entries
     
     def search_entries(self, query: str) -> List[KnowledgeEntry]:
@@ -543,24 +1065,28 @@ Remember: Every problem has a kawaii solution! (òωó)
         query_lower = query.lower()
         matches = []
         
-        for entry in self.entries.values():
-            # Check title and content
-            if (query_lower in entry.title.lower() or 
-                query_lower in entry.content.lower() or
-                any(query_lower in tag.lower() for tag in entry.tags)):
-                matches.append(entry)
+        # Narrow down with the search index; entries are still checked below
+        # so results match a plain substring scan exactly
+        words = _WORD_RE.findall(query_lower)
+        if words:
+            candidate_ids = self._search_candidates(set(words))
+            candidates = [e for entry_id, e in self.entries.items() if entry_id in candidate_ids]
+        else:
+            candidates = self.entries.values()
         
-        # Sort by relevance (title matches first, then content)
-        def sort_key(entry):
-            if query_lower in entry.title.lower():
-                return (0, entry.rating)
-            elif any(query_lower in tag.lower() for tag in entry.tags):
-                return (1, entry.rating)
-            else:
-                return (2, entry.rating)
+        for entry in candidates:
+            # Check title, tags and content, ranking the match as we go
+            title, tags = self._lowered(entry)
+            if query_lower in title:
+                matches.append(((0, entry.rating), entry))
+            elif any(query_lower in tag for tag in tags):
+                matches.append(((1, entry.rating), entry))
+            elif query_lower in entry.content.lower():
+                matches.append(((2, entry.rating), entry))
         
-        matches.sort(key=sort_key, reverse=True)
-        return matches
+        # Sort by relevance (title matches first, then content)
+        matches.sort(key=lambda match: match[0], reverse=True)
+        return [entry for _, entry in matches]
     
     def update_entry(self, entry_id: str, updates: Dict[str, Any]) -> bool:
         """Update existing knowledge entry"""
@@ -578,7 +1104,8 @@ Remember: Every problem has a kawaii solution! (òωó)
                     setattr(entry, field, value)
             
             entry.updated_at = datetime.now()
-            self._save_knowledge_base()
+            self._index_entry(entry_id)
+            self._append_journal(entry_id)
             
             print(f"📝 Knowledge entry '{entry_id}' updated successfully! ♡")
             return True
@@ -596,7 +1123,12 @@ Remember: Every problem has a kawaii solution! (òωó)
         try:
             title = self.entries[entry_id].title
             del self.entries[entry_id]
-            self._save_knowledge_base()
+            self._unindex_entry(entry_id)
+            self._append_journal(entry_id, 'del')
+            try:
+                os.remove(_content_path(entry_id))
+            except FileNotFoundError:
+                pass
             
             print(f"🗑️ Knowledge entry '{title}' deleted. Bye bye! (òωó)")
             return True
@@ -612,17 +1144,28 @@ Remember: Every problem has a kawaii solution! (òωó)
     def record_usage(self, entry_id: str):
         """Record usage of a knowledge entry"""
         if entry_id in self.entries:
-            self.entries[entry_id].usage_count += 1
-            self._save_knowledge_base()
+            entry = self.entries[entry_id]
+            entry.usage_count += 1
+            if self._columns is not None:
+                self._columns.usage[self._columns.rows[entry_id]] = entry.usage_count
+            # Journaled right away: a one-line append, and nothing is lost if
+            # the instance goes away before exit
+            self._append_journal(entry_id)
     
     def get_popular_entries(self, limit: int = 10) -> List[KnowledgeEntry]:
         """Get most popular entries"""
-        popular_entries = sorted(
-            self.entries.values(),
-            key=lambda e: (e.usage_count, e.rating),
-            reverse=True
-        )
-        return popular_entries[:limit]
+        columns = self._entry_columns()
+        usage, rating = columns.usage, columns.rating
+        if numpy is not None and len(columns.ids) >= NUMPY_MIN_ROWS:
+            # Stable sort, so ties come out in the same order as nlargest
+            order = numpy.lexsort((
+                -numpy.frombuffer(rating, dtype=numpy.float64),
+                -numpy.frombuffer(usage, dtype=numpy.int64),
+            ))
+            top = order[:limit].tolist()
+        else:
+            top = heapq.nlargest(limit, range(len(columns.ids)), key=lambda row: (usage[row], rating[row]))
+        return [self.entries[columns.ids[row]] for row in top]
     
     def get_recent_entries(self, days: int = 30) -> List[KnowledgeEntry]:
         """Get recently added entries"""
@@ -646,8 +1189,7 @@ Remember: Every problem has a kawaii solution! (òωó)
                 'statistics': self.get_statistics()
             }
             
-            with open(export_path, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            _write_atomic(export_path, _dumps(export_data, indent=True))
             
             print(f"📤 Knowledge base exported to {export_path}! ♡")
             return True
@@ -659,24 +1201,25 @@ Remember: Every problem has a kawaii solution! (òωó)
     def import_knowledge_base(self, import_path: str) -> bool:
         """Import knowledge base from file"""
         try:
-            with open(import_path, 'r') as f:
-                import_data = json.load(f)
-            
             imported_count = 0
-            for entry_id, entry_data in import_data.get('entries', {}).items():
+            now_iso = datetime.now().isoformat()
+            for entry_id, entry_data in self._iter_import_entries(import_path):
                 # Generate new ID to avoid conflicts
                 original_id = entry_id
-                entry_data['created_at'] = datetime.now().isoformat()
-                entry_data['updated_at'] = datetime.now().isoformat()
+                entry_data['created_at'] = entry_data['updated_at'] = now_iso
                 
                 entry = KnowledgeEntry.from_dict(entry_data)
                 
                 # Generate new ID
                 entry.id = self._generate_id(entry.title)
                 self.entries[entry.id] = entry
+                self._index_entry(entry.id)
+                self._mark_dirty(entry.id)
                 imported_count += 1
+                if imported_count % IMPORT_FLUSH_EVERY == 0:
+                    self.flush()
             
-            self._save_knowledge_base()
+            self.flush()
             
             print(f"📥 Imported {imported_count} knowledge entries! ♡")
             return True
@@ -685,36 +1228,58 @@ Remember: Every problem has a kawaii solution! (òωó)
             print(f"❌ Error importing knowledge base: {e}")
             return False
     
+    def _iter_import_entries(self, import_path: str):
+        """Yield (entry_id, entry_data) pairs from an export file"""
+        if ijson is not None and os.path.getsize(import_path) > STREAM_IMPORT_MIN_BYTES:
+            # Parse incrementally so only one entry is in memory at a time
+            with open(import_path, 'rb') as f:
+                yield from ijson.kvitems(f, 'entries', use_float=True)
+            return
+        
+        with open(import_path, 'rb') as f:
+            import_data = _loads(f.read())
+        yield from import_data.get('entries', {}).items()
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get knowledge base statistics"""
-        entries = list(self.entries.values())
-        
-        # Count by type
-        type_counts = {}
-        for entry in entries:
-            ktype = entry.knowledge_type.value
-            type_counts[ktype] = type_counts.get(ktype, 0) + 1
-        
-        # Count by category
-        category_counts = {}
-        for entry in entries:
-            category_counts[entry.category] = category_counts.get(entry.category, 0) + 1
-        
-        # Calculate average rating
-        avg_rating = sum(entry.rating for entry in entries) / len(entries) if entries else 0
-        
-        # Total usage
-        total_usage = sum(entry.usage_count for entry in entries)
+        if self._stats_cache is None:
+            self._stats_cache = self._compute_statistics()
+        # Hand out a copy, so callers can't alter the cached numbers
+        stats = self._stats_cache
+        return {**stats, 'by_type': dict(stats['by_type']), 'by_category': dict(stats['by_category'])}
+    
+    def _compute_statistics(self) -> Dict[str, Any]:
+        """Compute get_statistics' result from the analytics columns"""
+        columns = self._entry_columns()
+        ids, usage, created = columns.ids, columns.usage, columns.created
+        count = len(ids)
+        most_used = newest = oldest = None
+        if numpy is not None and count >= NUMPY_MIN_ROWS:
+            usage_col = numpy.frombuffer(usage, dtype=numpy.int64)
+            created_col = numpy.frombuffer(created, dtype=numpy.float64)
+            most_used = self.entries[ids[int(usage_col.argmax())]]
+            newest = self.entries[ids[int(created_col.argmax())]]
+            oldest = self.entries[ids[int(created_col.argmin())]]
+            average_rating = float(numpy.frombuffer(columns.rating, dtype=numpy.float64).mean())
+            total_usage = int(usage_col.sum())
+        else:
+            rows = range(count)
+            if ids:
+                most_used = self.entries[ids[max(rows, key=usage.__getitem__)]]
+                newest = self.entries[ids[max(rows, key=created.__getitem__)]]
+                oldest = self.entries[ids[min(rows, key=created.__getitem__)]]
+            average_rating = sum(columns.rating) / count if count else 0
+            total_usage = sum(usage)
         
         return {
-            'total_entries': len(entries),
-            'by_type': type_counts,
-            'by_category': category_counts,
-            'average_rating': avg_rating,
+            'total_entries': count,
+            'by_type': dict(Counter(columns.type)),
+            'by_category': dict(Counter(columns.category)),
+            'average_rating': average_rating,
             'total_usage_count': total_usage,
-            'most_used_entry': max(entries, key=lambda e: e.usage_count).title if entries else None,
-            'newest_entry': max(entries, key=lambda e: e.created_at).title if entries else None,
-            'oldest_entry': min(entries, key=lambda e: e.created_at).title if entries else None,
+            'most_used_entry': most_used.title if most_used else None,
+            'newest_entry': newest.title if newest else None,
+            'oldest_entry': oldest.title if oldest else None,
             'kawaii_coverage': '100%'
         }
     
@@ -723,16 +1288,14 @@ Remember: Every problem has a kawaii solution! (òωó)
                            topic: Optional[str] = None) -> List[KnowledgeEntry]:
         """Create a personalized learning path"""
         # Filter entries based on criteria
-        candidate_entries = self.list_entries()
-        
-        if target_difficulty:
-            candidate_entries = [e for e in candidate_entries if e.difficulty == target_difficulty]
+        candidate_entries = self.list_entries(difficulty=target_difficulty)
         
         if topic:
+            topic_lower = topic.lower()
             candidate_entries = [
-                e for e in candidate_entries 
-                if topic.lower() in e.title.lower() or 
-                topic.lower() in e.content.lower()
+                e for e in candidate_entries
+                if topic_lower in self._lowered(e)[0] or
+                topic_lower in e.content.lower()
             ]
         
         # Sort by difficulty progression and rating
@@ -743,10 +1306,8 @@ Remember: Every problem has a kawaii solution! (òωó)
             DifficultyLevel.EXPERT: 4
         }
         
-        candidate_entries.sort(key=lambda e: (difficulty_order[e.difficulty], -e.rating))
-        
         # Limit to reasonable path length
-        return candidate_entries[:10]
+        return heapq.nsmallest(10, candidate_entries, key=lambda e: (difficulty_order[e.difficulty], -e.rating))
     
     def generate_kawaii_summary(self) -> str:
         """Generate a kawaii summary of the knowledge base"""
@@ -16,6 +16,9 @@ class MenuApp:
         self.title = title
         self.items = items
         self.index = 0
+        self._n = len(items)
+        self._label = f"🎀 {title} 🎀"
+        self._title_x = 0
 
     def run(self):
         curses.wrapper(self._run)
@@ -29,37 +32,53 @@ class MenuApp:
         curses.init_pair(1, curses.COLOR_MAGENTA, -1)
         curses.init_pair(2, curses.COLOR_CYAN, -1)
         curses.init_pair(3, curses.COLOR_YELLOW, -1)
+        self._title_attr = curses.color_pair(1)
+        self._hint_attr = curses.color_pair(2)
+        self._item_attrs = (curses.color_pair(0), curses.color_pair(3))
 
+        self._layout(stdscr)
+        self._render(stdscr)
         while True:
-            stdscr.clear()
-            self._render(stdscr)
             ch = stdscr.getch()
-            if ch in (curses.KEY_UP, ord('k')):
-                self.index = (self.index - 1) % len(self.items)
-            elif ch in (curses.KEY_DOWN, ord('j')):
-                self.index = (self.index + 1) % len(self.items)
+            if ch in (curses.KEY_UP, ord('k'), curses.KEY_DOWN, ord('j')):
+                # only the old and new highlighted rows change
+                prev = self.index
+                step = -1 if ch in (curses.KEY_UP, ord('k')) else 1
+                self.index = (self.index + step) % self._n
+                self._render_item(stdscr, prev)
+                self._render_item(stdscr, self.index)
+                stdscr.noutrefresh()
+                curses.doupdate()
             elif ch in (curses.KEY_ENTER, ord('\n')):
                 stdscr.clear()
                 stdscr.refresh()
                 self.items[self.index].action()
+                # the action wrote to the terminal behind curses' back
+                stdscr.clear()
+                self._render(stdscr)
+            elif ch == curses.KEY_RESIZE:
+                self._layout(stdscr)
+                stdscr.erase()
+                self._render(stdscr)
             elif ch in (ord('q'), ord('Q')):
                 break
 
-    def _render(self, stdscr):
+    def _layout(self, stdscr):
+        # only changes when the terminal is resized
         h, w = stdscr.getmaxyx()
-        title = f"🎀 {self.title} 🎀"
-        stdscr.attron(curses.color_pair(1))
-        stdscr.addstr(1, max(0, (w - len(title)) // 2), title)
-        stdscr.attroff(curses.color_pair(1))
-        stdscr.attron(curses.color_pair(2))
-        stdscr.addstr(3, 2, "Hello Kitty mode: choose an action (q to quit)")
-        stdscr.attroff(curses.color_pair(2))
+        self._title_x = max(0, (w - len(self._label)) // 2)
+
+    def _render(self, stdscr):
+        stdscr.addstr(1, self._title_x, self._label, self._title_attr)
+        stdscr.addstr(3, 2, "Hello Kitty mode: choose an action (q to quit)", self._hint_attr)
+
+        for i in range(self._n):
+            self._render_item(stdscr, i)
 
-        for i, item in enumerate(self.items):
-            prefix = "➤ " if i == self.index else "  "
-            color = curses.color_pair(3 if i == self.index else 0)
-            stdscr.attron(color)
-            stdscr.addstr(5 + i, 4, prefix + item.label)
-            stdscr.attroff(color)
+        stdscr.noutrefresh()
+        curses.doupdate()
 
-        stdscr.refresh()
+    def _render_item(self, stdscr, i: int):
+        selected = i == self.index
+        prefix = "➤ " if selected else "  "
+        stdscr.addstr(5 + i, 4, prefix + self.items[i].label, self._item_attrs[selected])
@@ -4,18 +4,38 @@
 Interface for managing Hello Kitty plugins and extending functionality
 """
 
+import atexit
+import bisect
 import json
 import os
-import subprocess
-import sys
-import shutil
-import hashlib
+import re
+import stat
+import tempfile
+import weakref
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Set, Tuple, Any
+from dataclasses import dataclass
 from enum import Enum
 
+# orjson is optional; the stdlib encoder is used when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# MessagePack is optional (ormsgpack preferred, then msgpack); with it, plugin
+# state files are written in that binary format instead of JSON
+try:
+    import ormsgpack as msgpack
+except ImportError:
+    try:
+        import msgpack
+    except ImportError:
+        msgpack = None
+
 # Hello Kitty themed paths
 PLUGIN_PATHS = {
     'plugins_dir': os.path.expanduser('~/.kawaii_plugins'),
@@ -25,6 +45,18 @@ PLUGIN_PATHS = {
     'cache_dir': os.path.expanduser('~/.kawaii_plugin_cache')
 }
 
+# One file per plugin: {"plugin": manifest, "installation": ... or null},
+# so a change to one plugin rewrites only its own file
+STATE_DIR = os.path.join(PLUGIN_PATHS['plugins_dir'], 'state')
+STATE_EXT = '.mpk' if msgpack is not None else '.json'
+
+# Single-file state from earlier versions, migrated into STATE_DIR on load
+LEGACY_PLUGINS_FILE = os.path.join(PLUGIN_PATHS['plugins_dir'], 'installed_plugins.json')
+
+# Characters dropped from, and whitespace runs collapsed in, generated ids
+_ID_STRIP_RE = re.compile(r'[^a-zA-Z0-9\s]')
+_ID_WS_RE = re.compile(r'\s+')
+
 # Plugin categories
 PLUGIN_CATEGORIES = {
     'theming': '🎨 Theme & Visual Plugins',
@@ -49,6 +81,87 @@ HK_PLUGIN_COLORS = {
 }
 
 
+def _dumps(data, indent: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON (compact unless indent is set)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data):
+    """Decode JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _encode_state(data) -> bytes:
+    """Encode a plugin state record in the STATE_EXT format"""
+    if msgpack is not None:
+        return msgpack.packb(data)
+    return _dumps(data, indent=True)
+
+
+def _decode_state(path: Path, raw: bytes):
+    """Decode a plugin state file, by its extension"""
+    if path.suffix == '.mpk':
+        if msgpack is None:
+            raise ValueError("MessagePack state file but msgpack is not installed")
+        return msgpack.unpackb(raw)
+    return _loads(raw)
+
+
+def _write_all(fd: int, data: bytes):
+    """os.write data to fd until all of it is written, then close fd"""
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Process umask, for giving mkstemp's 0600 temp files the usual file mode
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _write_atomic(path: str, payload: bytes):
+    """Write payload to path via a uniquely named sibling temp file and
+    os.replace; readers see the old file or the new one, never a torn one.
+    The file keeps its mode (new ones get what open() would give them).
+    No fsync: plugin state is small and a lost last write is harmless."""
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.', suffix='.tmp')
+    try:
+        try:
+            os.fchmod(fd, mode)
+        except BaseException:
+            os.close(fd)
+            raise
+        _write_all(fd, payload)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _write_files(directory: str, files: Dict[str, Any]):
+    """Write each name -> str/bytes content into directory with raw os.write
+    calls, skipping the buffered text IO layer"""
+    for filename, content in files.items():
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        _write_all(os.open(os.path.join(directory, filename), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644), data)
+
+
 class PluginStatus(Enum):
     """Plugin status states"""
     ENABLED = "enabled"
@@ -68,9 +181,22 @@ class PluginType(Enum):
     CUSTOM = "custom"
 
 
+# Enum value -> member, to avoid Enum() lookups when loading state
+# (unknown values still go through Enum() so they raise as before)
+_STATUS_BY_VALUE = {member.value: member for member in PluginStatus}
+_TYPE_BY_VALUE = {member.value: member for member in PluginType}
+
+
 @dataclass
 class PluginManifest:
     """Plugin manifest and metadata"""
+    # Hand-written __slots__ (dataclass(slots=True) needs Python 3.10)
+    __slots__ = ('id', 'name', 'version', 'description', 'author', 'category',
+                 'plugin_type', 'dependencies', 'conflicts', 'min_version',
+                 'max_version', 'homepage', 'repository', 'license', 'tags',
+                 'hello_kitty_compatible', 'kawaii_level', 'rating', 'downloads',
+                 'created_at', 'updated_at')
+    
     id: str
     name: str
     version: str
@@ -94,23 +220,46 @@ class PluginManifest:
     updated_at: datetime
     
     def to_dict(self) -> Dict:
-        data = asdict(self)
-        data['created_at'] = self.created_at.isoformat()
-        data['updated_at'] = self.updated_at.isoformat()
-        data['plugin_type'] = self.plugin_type.value
-        return data
+        # Built by hand rather than with asdict, which deep-copies every field;
+        # the lists are copied so callers can't alter the manifest through it
+        return {
+            'id': self.id,
+            'name': self.name,
+            'version': self.version,
+            'description': self.description,
+            'author': self.author,
+            'category': self.category,
+            'plugin_type': self.plugin_type.value,
+            'dependencies': list(self.dependencies),
+            'conflicts': list(self.conflicts),
+            'min_version': self.min_version,
+            'max_version': self.max_version,
+            'homepage': self.homepage,
+            'repository': self.repository,
+            'license': self.license,
+            'tags': list(self.tags),
+            'hello_kitty_compatible': self.hello_kitty_compatible,
+            'kawaii_level': self.kawaii_level,
+            'rating': self.rating,
+            'downloads': self.downloads,
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat(),
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'PluginManifest':
         data['created_at'] = datetime.fromisoformat(data['created_at'])
         data['updated_at'] = datetime.fromisoformat(data['updated_at'])
-        data['plugin_type'] = PluginType(data['plugin_type'])
+        data['plugin_type'] = _TYPE_BY_VALUE.get(data['plugin_type']) or PluginType(data['plugin_type'])
         return cls(**data)
 
 
 @dataclass
 class PluginInstallation:
     """Plugin installation information"""
+    __slots__ = ('plugin_id', 'installation_path', 'status', 'installed_at',
+                 'enabled_at', 'configuration', 'usage_stats', 'error_message')
+    
     plugin_id: str
     installation_path: str
     status: PluginStatus
@@ -121,11 +270,43 @@ class PluginInstallation:
     error_message: Optional[str]
     
     def to_dict(self) -> Dict:
-        data = asdict(self)
-        data['status'] = self.status.value
-        data['installed_at'] = self.installed_at.isoformat()
-        data['enabled_at'] = self.enabled_at.isoformat() if self.enabled_at else None
-        return data
+        return {
+            'plugin_id': self.plugin_id,
+            'installation_path': self.installation_path,
+            'status': self.status.value,
+            'installed_at': self.installed_at.isoformat(),
+            'enabled_at': self.enabled_at.isoformat() if self.enabled_at else None,
+            'configuration': dict(self.configuration),
+            'usage_stats': dict(self.usage_stats),
+            'error_message': self.error_message,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'PluginInstallation':
+        return cls(
+            plugin_id=data['plugin_id'],
+            installation_path=data['installation_path'],
+            status=_STATUS_BY_VALUE.get(data['status']) or PluginStatus(data['status']),
+            installed_at=datetime.fromisoformat(data['installed_at']),
+            enabled_at=datetime.fromisoformat(data['enabled_at']) if data['enabled_at'] else None,
+            configuration=data.get('configuration', {}),
+            usage_stats=data.get('usage_stats', {}),
+            error_message=data.get('error_message')
+        )
+
+
+# Managers still in use; one exit hook flushes them, without keeping
+# replaced instances alive until exit
+_live_managers: 'weakref.WeakSet[KawaiiPluginManager]' = weakref.WeakSet()
+
+
+def _flush_live_managers():
+    """Write whatever the live managers still have queued"""
+    for instance in list(_live_managers):
+        instance.flush()
+
+
+atexit.register(_flush_live_managers)
 
 
 class KawaiiPluginManager:
@@ -135,6 +316,33 @@ class KawaiiPluginManager:
         self.plugins: Dict[str, PluginManifest] = {}
         self.installations: Dict[str, PluginInstallation] = {}
         
+        # Plugins changed since their state files were written; saved right
+        # away unless inside batch()
+        self._dirty: Set[str] = set()
+        self._autoflush = True
+        
+        # Set when state files exist that could not be read
+        self._unread_state = False
+        
+        # Lookup indexes, kept in step with self.plugins by _add_plugin:
+        # category / plugin type -> ids, and each plugin's lowercased name,
+        # description and tags, both as fields and joined into one string
+        self._by_category: Dict[str, Set[str]] = {}
+        self._by_type: Dict[PluginType, Set[str]] = {}
+        self._search_fields: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {}
+        self._search_corpus: Dict[str, str] = {}
+        
+        # (rating, name, id) for every plugin, kept sorted ascending; listings
+        # walk it backwards, so they come out best-rated first with no sort
+        self._sorted_keys: List[Tuple[float, str, str]] = []
+        
+        # Running totals behind get_all_plugin_stats: manifest totals kept by
+        # _add_plugin, the enabled ids by _restat (via _mark_dirty). The
+        # enabled ids also answer the dependency and conflict checks.
+        self._hk_compatible = 0
+        self._rating_sum = 0.0
+        self._enabled_ids: Set[str] = set()
+        
         # Initialize directories
         self._initialize_directories()
         
@@ -143,69 +351,178 @@ class KawaiiPluginManager:
         
         # Initialize default plugins
         self._initialize_default_plugins()
+        
+        # One pass to count what was loaded; mutations keep it current
+        for plugin_id in self.installations:
+            self._restat(plugin_id)
+        
+        # Whatever a batch left unsaved lands on exit
+        _live_managers.add(self)
     
     def _initialize_directories(self):
         """Create plugin directory structure"""
-        for path in PLUGIN_PATHS.values():
-            Path(path).mkdir(parents=True, exist_ok=True)
+        # One mkdir per directory; only a missing parent needs the slow path
+        for path in (*PLUGIN_PATHS.values(), STATE_DIR):
+            try:
+                os.mkdir(path)
+            except FileExistsError:
+                pass
+            except FileNotFoundError:
+                Path(path).mkdir(parents=True, exist_ok=True)
     
     def _load_plugins(self):
         """Load installed plugins from disk"""
-        plugins_file = os.path.join(PLUGIN_PATHS['plugins_dir'], 'installed_plugins.json')
+        # Manifests are loaded eagerly on purpose: list_plugins, search and the
+        # statistics read the name, category, type, rating, description and
+        # tags of every plugin, which is nearly the whole manifest, so an index
+        # plus an LRU of lazily read manifests would duplicate that data
+        # without saving a read. The TUI only builds the manager on first use.
+        state_files: Dict[str, List[Path]] = {}
+        for state_file in sorted(Path(STATE_DIR).glob('*.json')) + sorted(Path(STATE_DIR).glob('*.mpk')):
+            state_files.setdefault(state_file.stem, []).append(state_file)
+        if not state_files:
+            self._migrate_legacy_plugins()
+            return
+        
+        # A file in the other format is read, rewritten as STATE_EXT and only
+        # then removed; files that could not be read are left alone (msgpack
+        # may be missing for now), and stop the defaults being seeded
+        converted: List[Path] = []
+        for plugin_id, paths in state_files.items():
+            paths.sort(key=lambda path: path.suffix != STATE_EXT)
+            for state_file in paths:
+                try:
+                    with open(state_file, 'rb') as f:
+                        data = _decode_state(state_file, f.read())
+                    plugin = PluginManifest.from_dict(data['plugin'])
+                    installation = data.get('installation')
+                    installation = PluginInstallation.from_dict(installation) if installation else None
+                except Exception as e:
+                    print(f"⚠️ Error loading plugin {plugin_id} from {state_file.name}: {e}")
+                    continue
+                self._add_plugin(plugin_id, plugin)
+                if installation is not None:
+                    self.installations[plugin_id] = installation
+                if state_file.suffix != STATE_EXT:
+                    self._dirty.add(plugin_id)
+                    converted.append(state_file)
+                break
+            else:
+                self._unread_state = True
+        
+        if converted:
+            self.flush()
+            for path in converted:
+                if path.stem not in self._dirty:
+                    path.unlink()
+    
+    def _migrate_legacy_plugins(self):
+        """Load the old single-file state and split it into per-plugin files"""
+        try:
+            with open(LEGACY_PLUGINS_FILE, 'rb') as f:
+                data = _loads(f.read())
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"❌ Error loading plugins: {e}")
+            return
         
-        if os.path.exists(plugins_file):
+        # Load plugins
+        for plugin_id, plugin_data in data.get('plugins', {}).items():
             try:
-                with open(plugins_file, 'r') as f:
-                    data = json.load(f)
-                
-                # Load plugins
-                for plugin_id, plugin_data in data.get('plugins', {}).items():
-                    try:
-                        plugin = PluginManifest.from_dict(plugin_data)
-                        self.plugins[plugin_id] = plugin
-                    except Exception as e:
-                        print(f"⚠️ Error loading plugin {plugin_id}: {e}")
-                
-                # Load installations
-                for plugin_id, install_data in data.get('installations', {}).items():
-                    try:
-                        installation = PluginInstallation(
-                            plugin_id=install_data['plugin_id'],
-                            installation_path=install_data['installation_path'],
-                            status=PluginStatus(install_data['status']),
-                            installed_at=datetime.fromisoformat(install_data['installed_at']),
-                            enabled_at=datetime.fromisoformat(install_data['enabled_at']) if install_data['enabled_at'] else None,
-                            configuration=install_data.get('configuration', {}),
-                            usage_stats=install_data.get('usage_stats', {}),
-                            error_message=install_data.get('error_message')
-                        )
-                        self.installations[plugin_id] = installation
-                    except Exception as e:
-                        print(f"⚠️ Error loading installation {plugin_id}: {e}")
-                        
+                self._add_plugin(plugin_id, PluginManifest.from_dict(plugin_data))
             except Exception as e:
-                print(f"❌ Error loading plugins: {e}")
+                print(f"⚠️ Error loading plugin {plugin_id}: {e}")
+        
+        # Load installations
+        for plugin_id, install_data in data.get('installations', {}).items():
+            try:
+                self.installations[plugin_id] = PluginInstallation.from_dict(install_data)
+            except Exception as e:
+                print(f"⚠️ Error loading installation {plugin_id}: {e}")
+        
+        if self._save_plugins():
+            os.replace(LEGACY_PLUGINS_FILE, LEGACY_PLUGINS_FILE + '.migrated')
     
-    def _save_plugins(self):
-        """Save plugins to disk"""
-        plugins_file = os.path.join(PLUGIN_PATHS['plugins_dir'], 'installed_plugins.json')
+    def _add_plugin(self, plugin_id: str, plugin: PluginManifest):
+        """Register a plugin manifest and index it"""
+        old = self.plugins.get(plugin_id)
+        if old is not None:
+            self._by_category[old.category].discard(plugin_id)
+            self._by_type[old.plugin_type].discard(plugin_id)
+            self._sorted_keys.remove((old.rating, old.name, plugin_id))
+            self._hk_compatible -= old.hello_kitty_compatible
+            self._rating_sum -= old.rating
         
+        self.plugins[plugin_id] = plugin
+        self._hk_compatible += plugin.hello_kitty_compatible
+        self._rating_sum += plugin.rating
+        bisect.insort(self._sorted_keys, (plugin.rating, plugin.name, plugin_id))
+        self._by_category.setdefault(plugin.category, set()).add(plugin_id)
+        self._by_type.setdefault(plugin.plugin_type, set()).add(plugin_id)
+        fields = (plugin.name.lower(), plugin.description.lower(),
+                  tuple(tag.lower() for tag in plugin.tags))
+        self._search_fields[plugin_id] = fields
+        self._search_corpus[plugin_id] = '\0'.join((fields[0], fields[1], *fields[2]))
+    
+    def _restat(self, plugin_id: str):
+        """Bring the installation totals up to date for one plugin"""
+        installation = self.installations.get(plugin_id)
+        if installation is not None and installation.status == PluginStatus.ENABLED:
+            self._enabled_ids.add(plugin_id)
+        else:
+            self._enabled_ids.discard(plugin_id)
+    
+    def _save_one(self, plugin_id: str) -> bool:
+        """Save one plugin's manifest and installation to its state file"""
         try:
+            installation = self.installations.get(plugin_id)
             data = {
-                'plugins': {plugin_id: plugin.to_dict() for plugin_id, plugin in self.plugins.items()},
-                'installations': {plugin_id: installation.to_dict() for plugin_id, installation in self.installations.items()},
-                'last_updated': datetime.now().isoformat()
+                'plugin': self.plugins[plugin_id].to_dict(),
+                'installation': installation.to_dict() if installation else None
             }
-            
-            with open(plugins_file, 'w') as f:
-                json.dump(data, f, indent=2)
-                
+            _write_atomic(os.path.join(STATE_DIR, plugin_id + STATE_EXT), _encode_state(data))
+            return True
         except Exception as e:
-            print(f"❌ Error saving plugins: {e}")
+            print(f"❌ Error saving plugin '{plugin_id}': {e}")
+            return False
+    
+    def _save_plugins(self) -> bool:
+        """Save every plugin to disk"""
+        self._dirty.update(self.plugins)
+        return self.flush()
+    
+    def _mark_dirty(self, plugin_id: str):
+        """Queue a plugin to be saved, saving now outside of batch()"""
+        self._restat(plugin_id)
+        self._dirty.add(plugin_id)
+        if self._autoflush:
+            self.flush()
+    
+    def flush(self) -> bool:
+        """Write the state files of all changed plugins"""
+        saved = True
+        for plugin_id in list(self._dirty):
+            if plugin_id not in self.plugins or self._save_one(plugin_id):
+                self._dirty.discard(plugin_id)
+            else:
+                saved = False
+        return saved
+    
+    @contextmanager
+    def batch(self):
+        """Defer saves until the block ends, then write each changed plugin once"""
+        autoflush, self._autoflush = self._autoflush, False
+        try:
+            yield self
+        finally:
+            self._autoflush = autoflush
+            if autoflush:
+                self.flush()
     
     def _initialize_default_plugins(self):
         """Initialize default Hello Kitty plugins"""
-        if self.plugins:
+        if self.plugins or self._unread_state:
             return  # Already initialized
         
         default_plugins = [
@@ -355,10 +672,10 @@ class KawaiiPluginManager:
         ]
         
         # Add default plugins
-        for plugin in default_plugins:
-            self.plugins[plugin.id] = plugin
-        
-        self._save_plugins()
+        with self.batch():
+            for plugin in default_plugins:
+                self._add_plugin(plugin.id, plugin)
+                self._mark_dirty(plugin.id)
     
     def list_plugins(self, 
                     category: Optional[str] = None,
@@ -367,13 +684,18 @@ class KawaiiPluginManager:
         """List plugins with optional filtering"""
         results = []
         
-        for plugin_id, plugin in self.plugins.items():
-            # Apply filters
-            if category and plugin.category != category:
-                continue
-            
-            if plugin_type and plugin.plugin_type != plugin_type:
+        # Apply filters
+        plugin_ids = self.plugins.keys()
+        if category:
+            plugin_ids = self._by_category.get(category, set()) & plugin_ids
+        if plugin_type:
+            plugin_ids = self._by_type.get(plugin_type, set()) & plugin_ids
+        
+        # Walk in (rating, name) order, highest first
+        for _, _, plugin_id in reversed(self._sorted_keys):
+            if plugin_id not in plugin_ids:
                 continue
+            plugin = self.plugins[plugin_id]
             
             # Get installation status
             installation = self.installations.get(plugin_id)
@@ -384,9 +706,6 @@ class KawaiiPluginManager:
             
             results.append((plugin, status))
         
-        # Sort by rating and name
-        results.sort(key=lambda x: (x[0].rating, x[0].name), reverse=True)
-        
         return results
     
     def get_plugin(self, plugin_id: str) -> Optional[PluginManifest]:
@@ -424,15 +743,18 @@ class KawaiiPluginManager:
                 error_message=None
             )
             
-            # Create plugin directory
-            os.makedirs(installation_path, exist_ok=True)
+            # Create plugin directory (plugins_dir exists from startup)
+            try:
+                os.mkdir(installation_path)
+            except FileExistsError:
+                pass
             
             # Install plugin files (simplified)
             self._install_plugin_files(plugin_id, installation_path)
             
             # Store installation
             self.installations[plugin_id] = installation
-            self._save_plugins()
+            self._mark_dirty(plugin_id)
             
             print(f"📦 Plugin '{plugin.name}' installed successfully! ♡")
             return True
@@ -441,29 +763,34 @@ class KawaiiPluginManager:
             print(f"❌ Error installing plugin '{plugin_id}': {e}")
             return False
     
+    def install_plugins(self, plugin_ids: List[str], source: str = "local") -> Dict[str, bool]:
+        """Install several plugins, in order, writing their state once at the end"""
+        with self.batch():
+            return {plugin_id: self.install_plugin(plugin_id, source) for plugin_id in plugin_ids}
+    
     def _check_dependencies(self, plugin: PluginManifest) -> bool:
         """Check if plugin dependencies are satisfied"""
-        for dep_id in plugin.dependencies:
-            if dep_id not in self.installations:
-                print(f"  ❌ Missing dependency: {dep_id}")
-                return False
-            
-            dep_install = self.installations[dep_id]
-            if dep_install.status != PluginStatus.ENABLED:
-                print(f"  ❌ Dependency not enabled: {dep_id}")
-                return False
+        missing = set(plugin.dependencies) - self._enabled_ids
+        if not missing:
+            return True
         
-        return True
+        # Report the first unsatisfied dependency, in declaration order
+        dep_id = next(d for d in plugin.dependencies if d in missing)
+        if dep_id not in self.installations:
+            print(f"  ❌ Missing dependency: {dep_id}")
+        else:
+            print(f"  ❌ Dependency not enabled: {dep_id}")
+        return False
     
     def _check_conflicts(self, plugin: PluginManifest) -> bool:
         """Check for plugin conflicts"""
-        for conflict_id in plugin.conflicts:
-            if conflict_id in self.installations:
-                conflict_install = self.installations[conflict_id]
-                if conflict_install.status == PluginStatus.ENABLED:
-                    print(f"  ❌ Conflict with enabled plugin: {conflict_id}")
-                    return True
-        return False
+        clashing = set(plugin.conflicts) & self._enabled_ids
+        if not clashing:
+            return False
+        
+        conflict_id = next(c for c in plugin.conflicts if c in clashing)
+        print(f"  ❌ Conflict with enabled plugin: {conflict_id}")
+        return True
     
     def _install_plugin_files(self, plugin_id: str, installation_path: str):
         """Install plugin files (placeholder implementation)"""
@@ -487,12 +814,12 @@ def get_plugin_info():
         'kawaii_level': 'MAXIMUM'
     }}
             ''',
-            'config.json': json.dumps({
+            'config.json': _dumps({
                 'plugin_id': plugin_id,
                 'enabled': True,
                 'settings': {},
                 'hello_kitty_theme': True
-            }, indent=2),
+            }, indent=True),
             'README.md': f'''# {plugin_id.title()} Plugin
 
 🎀 Hello Kitty Compatible Plugin
@@ -510,10 +837,7 @@ Configure through Kawaii TUI Plugin Manager.
             '''
         }
         
-        for filename, content in plugin_files.items():
-            file_path = os.path.join(installation_path, filename)
-            with open(file_path, 'w') as f:
-                f.write(content)
+        _write_files(installation_path, plugin_files)
     
     def enable_plugin(self, plugin_id: str) -> bool:
         """Enable an installed plugin"""
@@ -533,7 +857,7 @@ Configure through Kawaii TUI Plugin Manager.
             # Enable plugin
             installation.status = PluginStatus.ENABLED
             installation.enabled_at = datetime.now()
-            self._save_plugins()
+            self._mark_dirty(plugin_id)
             
             # Load plugin (simplified)
             self._load_plugin(plugin_id)
@@ -557,7 +881,7 @@ Configure through Kawaii TUI Plugin Manager.
             
             # Disable plugin
             installation.status = PluginStatus.DISABLED
-            self._save_plugins()
+            self._mark_dirty(plugin_id)
             
             print(f"💤 Plugin '{plugin.name}' disabled. See you later! (òωó)")
             return True
@@ -591,12 +915,15 @@ Configure through Kawaii TUI Plugin Manager.
                 self.disable_plugin(plugin_id)
             
             # Remove plugin directory
-            if os.path.exists(installation.installation_path):
+            import shutil
+            try:
                 shutil.rmtree(installation.installation_path)
+            except FileNotFoundError:
+                pass
             
             # Remove from tracking
             del self.installations[plugin_id]
-            self._save_plugins()
+            self._mark_dirty(plugin_id)
             
             print(f"🗑️ Plugin '{plugin.name}' uninstalled completely. Bye bye! (òωó)")
             return True
@@ -614,7 +941,7 @@ Configure through Kawaii TUI Plugin Manager.
             
             installation = self.installations[plugin_id]
             installation.configuration.update(config)
-            self._save_plugins()
+            self._mark_dirty(plugin_id)
             
             plugin = self.plugins[plugin_id]
             print(f"⚙️ Plugin '{plugin.name}' configured successfully! ♡")
@@ -646,7 +973,7 @@ Configure through Kawaii TUI Plugin Manager.
             plugin.version = new_version or plugin.version
             plugin.updated_at = datetime.now()
             
-            self._save_plugins()
+            self._mark_dirty(plugin_id)
             print(f"✨ Plugin '{plugin.name}' updated successfully! ♡")
             return True
             
@@ -707,9 +1034,9 @@ Configure through Kawaii TUI Plugin Manager.
             self._create_custom_plugin_files(plugin_id, plugin_name, description)
             
             # Store plugin and installation
-            self.plugins[plugin_id] = plugin
+            self._add_plugin(plugin_id, plugin)
             self.installations[plugin_id] = installation
-            self._save_plugins()
+            self._mark_dirty(plugin_id)
             
             print(f"🎨 Custom plugin '{plugin_name}' created successfully! ♡")
             return True
@@ -720,16 +1047,12 @@ Configure through Kawaii TUI Plugin Manager.
     
     def _generate_plugin_id(self, plugin_name: str) -> str:
         """Generate unique plugin ID"""
-        import re
-        clean_name = re.sub(r'[^a-zA-Z0-9\s]', '', plugin_name).lower()
-        clean_name = re.sub(r'\s+', '_', clean_name)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"{clean_name}_{timestamp}"
+        clean_name = _ID_WS_RE.sub('_', _ID_STRIP_RE.sub('', plugin_name).lower())
+        n = datetime.now()
+        return f"{clean_name}_{n.year:04d}{n.month:02d}{n.day:02d}_{n.hour:02d}{n.minute:02d}{n.second:02d}"
     
     def _create_custom_plugin_files(self, plugin_id: str, name: str, description: str):
         """Create files for custom plugin"""
-        plugin_file = os.path.join(PLUGIN_PATHS['plugins_dir'], plugin_id, 'plugin.py')
-        
         plugin_content = f'''#!/usr/bin/env python3
 """
 🎀 Custom Plugin: {name}
@@ -762,8 +1085,7 @@ def get_plugin_info():
     return plugin.get_info()
         '''
         
-        with open(plugin_file, 'w') as f:
-            f.write(plugin_content)
+        _write_files(os.path.join(PLUGIN_PATHS['plugins_dir'], plugin_id), {'plugin.py': plugin_content})
     
     def get_plugin_stats(self, plugin_id: str) -> Dict[str, Any]:
         """Get plugin usage statistics"""
@@ -774,22 +1096,20 @@ def get_plugin_info():
     
     def get_all_plugin_stats(self) -> Dict[str, Any]:
         """Get overall plugin statistics"""
-        enabled_plugins = [p for p, s in self.installations.items() if s.status == PluginStatus.ENABLED]
-        installed_plugins = list(self.installations.keys())
-        
-        # Count by category
+        # Counted per call, in install order, so the report lists categories
+        # in the order their first plugin was installed
         category_counts = {}
-        for plugin_id in installed_plugins:
-            plugin = self.plugins[plugin_id]
-            category_counts[plugin.category] = category_counts.get(plugin.category, 0) + 1
+        for plugin_id in self.installations:
+            category = self.plugins[plugin_id].category
+            category_counts[category] = category_counts.get(category, 0) + 1
         
         return {
             'total_plugins': len(self.plugins),
-            'installed_plugins': len(installed_plugins),
-            'enabled_plugins': len(enabled_plugins),
+            'installed_plugins': len(self.installations),
+            'enabled_plugins': len(self._enabled_ids),
             'by_category': category_counts,
-            'kawaii_coverage': f"{len([p for p in self.plugins.values() if p.hello_kitty_compatible])}/{len(self.plugins)} plugins",
-            'average_rating': sum(p.rating for p in self.plugins.values()) / len(self.plugins) if self.plugins else 0
+            'kawaii_coverage': f"{self._hk_compatible}/{len(self.plugins)} plugins",
+            'average_rating': self._rating_sum / len(self.plugins) if self.plugins else 0
         }
     
     def search_plugins(self, query: str) -> List[PluginManifest]:
@@ -797,25 +1117,26 @@ def get_plugin_info():
         query_lower = query.lower()
         matches = []
         
-        for plugin in self.plugins.values():
-            if (query_lower in plugin.name.lower() or
-                query_lower in plugin.description.lower() or
-                any(query_lower in tag.lower() for tag in plugin.tags)):
-                matches.append(plugin)
-        
-        # Sort by relevance and rating
-        def sort_key(plugin):
+        for plugin_id, corpus in self._search_corpus.items():
+            # One C-level scan rules out plugins the query can't match
+            if corpus.find(query_lower) == -1:
+                continue
+            # Score while matching: any field hit makes the relevance non-zero
+            name_lower, desc_lower, tags_lower = self._search_fields[plugin_id]
             relevance = 0
-            if query_lower in plugin.name.lower():
+            if query_lower in name_lower:
                 relevance += 10
-            if query_lower in plugin.description.lower():
+            if query_lower in desc_lower:
                 relevance += 5
-            if any(query_lower in tag.lower() for tag in plugin.tags):
+            if any(query_lower in tag for tag in tags_lower):
                 relevance += 3
-            return (relevance, plugin.rating)
+            if relevance:
+                plugin = self.plugins[plugin_id]
+                matches.append(((relevance, plugin.rating), plugin))
         
-        matches.sort(key=sort_key, reverse=True)
-        return matches
+        # Sort by relevance and rating
+        matches.sort(key=itemgetter(0), reverse=True)
+        return [plugin for _, plugin in matches]
     
     def export_plugin_config(self, export_path: str) -> bool:
         """Export plugin configuration"""
@@ -828,8 +1149,8 @@ def get_plugin_info():
                 'statistics': self.get_all_plugin_stats()
             }
             
-            with open(export_path, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            with open(export_path, 'wb') as f:
+                f.write(_dumps(export_data, indent=True))
             
             print(f"📤 Plugin configuration exported to {export_path}! ♡")
             return True